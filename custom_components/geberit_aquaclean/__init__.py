@@ -1,31 +1,47 @@
 """Geberit AquaClean integration."""
-import asyncio
-import contextlib
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
 import logging
-from datetime import timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.const import CONF_MAC
-from homeassistant.core import HomeAssistant, CoreState, callback
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth.active_update_coordinator import ActiveBluetoothDataUpdateCoordinator
 
-from .const import DOMAIN
-from .geberit_client import GeberitAquaCleanClient
+from .const import (
+    CONF_ACTIVE_POLL_INTERVAL,
+    CONF_IDLE_POLL_INTERVAL,
+    DEFAULT_ACTIVE_POLL_INTERVAL,
+    DEFAULT_IDLE_POLL_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import GeberitActiveBluetoothCoordinator
+    from .geberit_client import GeberitAquaCleanClient
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SWITCH, Platform.NUMBER, Platform.SENSOR, Platform.LIGHT]
 
-SCAN_INTERVAL = timedelta(seconds=15)
+
+@dataclass
+class GeberitAquaCleanData:
+    """Runtime data stored on the config entry."""
+
+    client: GeberitAquaCleanClient
+    coordinator: GeberitActiveBluetoothCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Geberit AquaClean from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    # Deferred so the BLE client and coordinator stack only load once an entry is set up
+    from .coordinator import GeberitActiveBluetoothCoordinator
+    from .geberit_client import GeberitAquaCleanClient
 
     mac_address = entry.data[CONF_MAC]
     
@@ -35,31 +51,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("No connectable Bluetooth adapters found for %s", mac_address)
         return False
     
-    # Initialize the client with shared scanner (best practice)
-    scanner = bluetooth.async_get_scanner(hass)
-    client = GeberitAquaCleanClient(mac_address, hass, scanner)
+    # The client resolves the device through the shared Bluetooth manager
+    client = GeberitAquaCleanClient(mac_address, hass)
     
     # Get BLE device for coordinator
     ble_device = bluetooth.async_ble_device_from_address(
-        hass, mac_address.upper(), connectable=True
+        hass, client.mac_upper, connectable=True
     )
     if not ble_device:
         raise ConfigEntryNotReady(f"Could not find Geberit AquaClean device with address {mac_address}")
     
     # Create ActiveBluetoothCoordinator (best practice for devices needing active connections)
     coordinator = GeberitActiveBluetoothCoordinator(hass, client, ble_device, entry.title, entry.unique_id)
+    coordinator.async_set_poll_intervals(
+        entry.options.get(CONF_ACTIVE_POLL_INTERVAL, DEFAULT_ACTIVE_POLL_INTERVAL),
+        entry.options.get(CONF_IDLE_POLL_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL),
+    )
     entry.async_on_unload(coordinator.async_start())
     
-    # Wait for device to be ready
+    # Platforms create entities from the feature set, which is otherwise only
+    # known after the first connection. Reload once the device reports a
+    # different set, so the entities match it
+    await client.async_load_features()
+    client.async_on_features_changed(
+        partial(hass.config_entries.async_schedule_reload, entry.entry_id)
+    )
+
+    # Wait for the device before setting up platforms, so retries while it is
+    # out of range do not register and tear down entities each time
     if not await coordinator.async_wait_ready():
         raise ConfigEntryNotReady(f"{mac_address} is not advertising state")
-    
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client": client,
-        "coordinator": coordinator,
-    }
 
-    # Set up platforms  
+    entry.runtime_data = GeberitAquaCleanData(client=client, coordinator=coordinator)
+
+    # Set up platforms; entities handle missing coordinator data until the
+    # first poll completes
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Add update listener for options changes
@@ -70,103 +96,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Poll intervals are applied in place, no need to reload the entry
+    coordinator = entry.runtime_data.coordinator
+    coordinator.async_set_poll_intervals(
+        entry.options.get(CONF_ACTIVE_POLL_INTERVAL, DEFAULT_ACTIVE_POLL_INTERVAL),
+        entry.options.get(CONF_IDLE_POLL_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL),
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        data = hass.data[DOMAIN].pop(entry.entry_id)
-        if client := data.get("client"):
-            await client.disconnect()
+        await entry.runtime_data.client.disconnect()
 
     return unload_ok
 
 
-class GeberitActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
-    """Active Bluetooth coordinator for Geberit AquaClean devices."""
-
-    def __init__(self, hass: HomeAssistant, client: GeberitAquaCleanClient, ble_device, device_name: str, base_unique_id: str):
-        """Initialize the coordinator."""
-        super().__init__(
-            hass=hass,
-            logger=_LOGGER,
-            address=ble_device.address,
-            needs_poll_method=self._needs_poll,
-            poll_method=self._async_update,
-            mode=bluetooth.BluetoothScanningMode.ACTIVE,
-            connectable=True,
-        )
-        self.client = client
-        self.ble_device = ble_device
-        self.device_name = device_name
-        self.base_unique_id = base_unique_id
-        self._ready_event = asyncio.Event()
-        self._was_unavailable = True
-
-    @callback
-    def _needs_poll(
-        self,
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        seconds_since_last_poll: float | None,
-    ) -> bool:
-        """Check if we need to poll the device."""
-        return (
-            self.hass.state == CoreState.running
-            and (seconds_since_last_poll is None or seconds_since_last_poll >= SCAN_INTERVAL.total_seconds())
-            and bool(
-                bluetooth.async_ble_device_from_address(
-                    self.hass, service_info.device.address, connectable=True
-                )
-            )
-        )
-
-    async def _async_update(self, service_info: bluetooth.BluetoothServiceInfoBleak):
-        """Poll the device for data."""
-        try:
-            return await self.client.get_device_state()
-        except Exception as exception:
-            raise UpdateFailed(f"Error communicating with API: {exception}")
-
-    async def async_wait_ready(self) -> bool:
-        """Wait for the device to be ready."""
-        with contextlib.suppress(asyncio.TimeoutError):
-            async with asyncio.timeout(30.0):  # 30 second timeout for device readiness
-                await self._ready_event.wait()
-                return True
-        return False
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a config entry."""
+    from .geberit_client import async_remove_feature_cache
 
-    @callback
-    def _async_handle_unavailable(
-        self, service_info: bluetooth.BluetoothServiceInfoBleak
-    ) -> None:
-        """Handle the device going unavailable."""
-        super()._async_handle_unavailable(service_info)
-        _LOGGER.warning("Device %s is unavailable", service_info.address)
-        self._was_unavailable = True
-        # Mark device as unavailable
-        if hasattr(self.client, '_device_state'):
-            self.client._device_state.connected = False
-
-    @callback
-    def _async_handle_bluetooth_event(
-        self,
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        change: bluetooth.BluetoothChange,
-    ) -> None:
-        """Handle a Bluetooth event (advertisement received)."""
-        self.ble_device = service_info.device
-        _LOGGER.debug("Bluetooth event from %s: %s", service_info.address, change)
-        self._ready_event.set()
-
-        if not self._was_unavailable:
-            return
-
-        self._was_unavailable = False
-        _LOGGER.info("Device %s is now available (RSSI: %s)", service_info.address, service_info.rssi)
-        super()._async_handle_bluetooth_event(service_info, change)
-
-    async def async_request_refresh(self) -> None:
-        """Request a refresh of the device data."""
-        _LOGGER.debug("Manual refresh requested for device %s", self.base_unique_id)
-        await self._async_update(self.last_service_info)
\ No newline at end of file
+    await async_remove_feature_cache(hass, entry.data[CONF_MAC])
@@ -3,11 +3,77 @@ from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass, BinarySensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .entity import GeberitAquaCleanEntity
+
+# Binary sensors paired with the features that enable them
+BINARY_SENSORS: tuple[tuple[BinarySensorEntityDescription, tuple[str, ...]], ...] = (
+    (
+        BinarySensorEntityDescription(
+            key="user_is_sitting",
+            name="User Present",
+            icon="mdi:account-check",
+            device_class=BinarySensorDeviceClass.OCCUPANCY,
+        ),
+        ("user_detection",),  # Always available on all models
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="anal_shower_running",
+            name="Rear Wash Active",
+            icon="mdi:shower",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        ("rear_wash",),
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="lady_shower_running", 
+            name="Front Wash Active",
+            icon="mdi:shower-head",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        ("lady_wash",),
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="dryer_running",
+            name="Air Dry Active",
+            icon="mdi:air-purifier",
+            device_class=BinarySensorDeviceClass.RUNNING,
+        ),
+        ("dryer",),
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="lid_position",
+            name="Lid Open",
+            icon="mdi:toilet",
+            device_class=BinarySensorDeviceClass.OPENING,
+        ),
+        ("lid_sensor",),
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="descaling_needed",
+            name="Descaling Required",
+            icon="mdi:alert-circle",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        ("descaling_system",),
+    ),
+    (
+        BinarySensorEntityDescription(
+            key="filter_replacement_needed",
+            name="Filter Replacement Required",
+            icon="mdi:air-filter",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+        ),
+        ("water_filter",),
+    ),
+)
 
 
 async def async_setup_entry(
@@ -16,123 +82,46 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary sensor platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][config_entry.entry_id]["client"]
-    
-    # Define all possible binary sensors with their feature requirements
-    BINARY_SENSOR_CONFIGS = [
-        {
-            "description": BinarySensorEntityDescription(
-                key="user_is_sitting",
-                name="User Present",
-                icon="mdi:account-check",
-                device_class=BinarySensorDeviceClass.OCCUPANCY,
-            ),
-            "features": ["user_detection"],  # Always available on all models
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="anal_shower_running",
-                name="Rear Wash Active",
-                icon="mdi:shower",
-                device_class=BinarySensorDeviceClass.RUNNING,
-            ),
-            "features": ["rear_wash"],
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="lady_shower_running", 
-                name="Front Wash Active",
-                icon="mdi:shower-head",
-                device_class=BinarySensorDeviceClass.RUNNING,
-            ),
-            "features": ["lady_wash"],
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="dryer_running",
-                name="Air Dry Active",
-                icon="mdi:air-purifier",
-                device_class=BinarySensorDeviceClass.RUNNING,
-            ),
-            "features": ["dryer"],
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="lid_position",
-                name="Lid Open",
-                icon="mdi:toilet",
-                device_class=BinarySensorDeviceClass.OPENING,
-            ),
-            "features": ["lid_sensor"],
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="descaling_needed",
-                name="Descaling Required",
-                icon="mdi:alert-circle",
-                device_class=BinarySensorDeviceClass.PROBLEM,
-            ),
-            "features": ["descaling_system"],
-        },
-        {
-            "description": BinarySensorEntityDescription(
-                key="filter_replacement_needed",
-                name="Filter Replacement Required",
-                icon="mdi:air-filter",
-                device_class=BinarySensorDeviceClass.PROBLEM,
-            ),
-            "features": ["water_filter"],
-        },
-    ]
-    
+    coordinator = config_entry.runtime_data.coordinator
+    client = config_entry.runtime_data.client
+
     # Only create entities for features that are available on this device
-    entities = []
-    for config in BINARY_SENSOR_CONFIGS:
-        # Check if any of the required features are available
-        if any(client.has_feature(feature) for feature in config["features"]):
-            entities.append(GeberitBinarySensor(coordinator, config["description"]))
-    
-    async_add_entities(entities)
+    async_add_entities(
+        GeberitBinarySensor(coordinator, description)
+        for description, features in BINARY_SENSORS
+        if any(client.has_feature(feature) for feature in features)
+    )
 
 
-class GeberitBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class GeberitBinarySensor(GeberitAquaCleanEntity, BinarySensorEntity):
     """Representation of a Geberit AquaClean binary sensor."""
 
     def __init__(self, coordinator, description: BinarySensorEntityDescription):
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
         self._attr_name = description.name
-        self._attr_unique_id = f"geberit_aquaclean_{description.key}_{coordinator.client.mac_address.replace(':', '')}"
         self._attr_device_class = description.device_class
         self._attr_icon = description.icon
+        self._update_cached_state()
+
+    @callback
+    def _update_cached_state(self) -> None:
+        """Cache the state read from the current coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            self._cached_is_on = None
+            self._cached_available = False
+            return
+        self._cached_is_on = getattr(data, self.entity_description.key, False)
+        self._cached_available = getattr(data, "connected", False)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.coordinator.data is None:
-            return None
-        return getattr(self.coordinator.data, self.entity_description.key, False)
+        return self._cached_is_on
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            self.coordinator.data is not None 
-            and getattr(self.coordinator.data, "connected", False)
-        )
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
+        return self._cached_available
@@ -1,18 +1,29 @@
 """Config flow for Geberit AquaClean integration."""
+from contextlib import suppress
+from functools import lru_cache
 import logging
+import re
+import time
 from typing import Any
 import voluptuous as vol
+from bleak.exc import BleakError
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_MAC
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 
-from .const import DOMAIN
-from .geberit_client import GeberitAquaCleanClient
+from .const import (
+    CONF_ACTIVE_POLL_INTERVAL,
+    CONF_IDLE_POLL_INTERVAL,
+    DEFAULT_ACTIVE_POLL_INTERVAL,
+    DEFAULT_IDLE_POLL_INTERVAL,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,49 +33,68 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+_MAC_RE = re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+
+# Matches the bluetooth matchers in manifest.json
+GEBERIT_MANUFACTURER_ID = 1281
+GEBERIT_LOCAL_NAME_PREFIXES = ("Geberit", "AquaClean")
+# Advertisements newer than this prove the device is reachable without connecting
+ADVERTISEMENT_FRESHNESS = 30
+# Picker value that switches the user step to manual MAC entry
+MANUAL_ENTRY = "manual"
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+    """Validate the user input against the Bluetooth scanner registry."""
     mac_address = data[CONF_MAC]
 
     # Validate MAC address format
     if not _is_valid_mac(mac_address):
         raise InvalidMac
 
-    # Try to find the device using HA Bluetooth
+    # A recent connectable advertisement is enough here; the coordinator's
+    # first poll after the entry is created is the real connection test
+    mac_upper = mac_address.upper()
     ble_device = bluetooth.async_ble_device_from_address(
-        hass, mac_address.upper(), connectable=True
+        hass, mac_upper, connectable=True
     )
     if not ble_device:
         raise CannotConnect
 
-    # Try to connect to validate the device
-    scanner = bluetooth.async_get_scanner(hass)
-    client = GeberitAquaCleanClient(mac_address, hass, scanner)
-    if not await client.connect():
-        await client.disconnect()
-        raise CannotConnect
-
-    await client.disconnect()
+    service_info = bluetooth.async_last_service_info(hass, mac_upper, connectable=True)
+    if service_info is None or time.monotonic() - service_info.time >= ADVERTISEMENT_FRESHNESS:
+        # The cached advertisement is stale, so probe the device with a bare
+        # connection; nothing is read from or stored for a device whose entry
+        # may never be created
+        client = None
+        try:
+            client = await establish_connection(
+                BleakClientWithServiceCache, ble_device, mac_address, max_attempts=2
+            )
+        except (BleakError, TimeoutError) as err:
+            raise CannotConnect from err
+        finally:
+            # Once connected the probe has succeeded, so a failing disconnect
+            # must not turn it into an unknown error
+            if client is not None:
+                with suppress(BleakError):
+                    await client.disconnect()
 
     # Return info that you want to store in the config entry.
     return {"title": f"Geberit AquaClean ({mac_address})"}
 
 
+def _is_geberit_device(service_info: BluetoothServiceInfoBleak) -> bool:
+    """Check if an advertisement comes from a Geberit AquaClean device."""
+    return GEBERIT_MANUFACTURER_ID in service_info.manufacturer_data or (
+        service_info.name or ""
+    ).startswith(GEBERIT_LOCAL_NAME_PREFIXES)
+
+
+@lru_cache(maxsize=32)
 def _is_valid_mac(mac: str) -> bool:
-    """Check if MAC address is valid."""
-    try:
-        # Check format XX:XX:XX:XX:XX:XX
-        parts = mac.split(":")
-        if len(parts) != 6:
-            return False
-        for part in parts:
-            if len(part) != 2:
-                return False
-            int(part, 16)
-        return True
-    except ValueError:
-        return False
+    """Check if MAC address is valid (format XX:XX:XX:XX:XX:XX)."""
+    return _MAC_RE.fullmatch(mac) is not None
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -75,7 +105,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
-        self._discovered_device: bluetooth.BluetoothServiceInfoBleak | None = None
+        self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -120,29 +158,87 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
-        
+
         if user_input is not None:
-            try:
-                info = await validate_input(self.hass, user_input)
-                
-                # Check if already configured
-                await self.async_set_unique_id(user_input[CONF_MAC])
-                self._abort_if_unique_id_configured()
-                
-                return self.async_create_entry(title=info["title"], data=user_input)
-                
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except InvalidMac:
-                errors[CONF_MAC] = "invalid_mac"
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+            if user_input[CONF_MAC] == MANUAL_ENTRY:
+                return await self.async_step_manual()
+            if result := await self._async_create_entry_from_input(user_input, errors):
+                return result
+        else:
+            self._async_discover_devices()
+
+        if not self._discovered_devices:
+            return await self.async_step_manual()
+
+        device_options = {
+            address: f"{service_info.name or 'Geberit AquaClean'} ({address})"
+            for address, service_info in self._discovered_devices.items()
+        }
+        device_options[MANUAL_ENTRY] = "Enter MAC address manually"
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema({vol.Required(CONF_MAC): vol.In(device_options)}),
+            errors=errors,
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle manual entry of the MAC address."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if result := await self._async_create_entry_from_input(user_input, errors):
+                return result
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def _async_create_entry_from_input(
+        self, user_input: dict[str, Any], errors: dict[str, str]
+    ) -> FlowResult | None:
+        """Validate the input and create the entry, or fill in errors."""
+        # Bluetooth discovery reports upper-case addresses; store manual
+        # entries the same way so both paths share one unique ID
+        user_input = {**user_input, CONF_MAC: user_input[CONF_MAC].upper()}
+        try:
+            info = await validate_input(self.hass, user_input)
+        except CannotConnect:
+            errors["base"] = "cannot_connect"
+        except InvalidMac:
+            errors[CONF_MAC] = "invalid_mac"
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception")
+            errors["base"] = "unknown"
+        else:
+            # Check if already configured
+            await self.async_set_unique_id(user_input[CONF_MAC])
+            self._abort_if_unique_id_configured()
+
+            return self.async_create_entry(title=info["title"], data=user_input)
+        return None
+
+    @callback
+    def _async_discover_devices(self) -> None:
+        """Collect unconfigured Geberit AquaClean devices, keyed by address."""
+        # Only devices the Bluetooth integration has already seen are offered,
+        # so the user step never waits for new advertisements
+        current_addresses = self._async_current_ids()
+
+        @callback
+        def _is_new_geberit_device(service_info: BluetoothServiceInfoBleak) -> bool:
+            return (
+                service_info.address not in current_addresses
+                and _is_geberit_device(service_info)
+            )
+
+        self._discovered_devices = {
+            service_info.address: service_info
+            for service_info in bluetooth.async_discovered_service_info(self.hass)
+            if _is_new_geberit_device(service_info)
+        }
+
     async def async_step_reauth(self, entry_data: dict[str, Any]) -> FlowResult:
         """Handle reauth upon an API authentication error."""
         return await self.async_step_reauth_confirm()
@@ -193,6 +289,32 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Geberit AquaClean options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling intervals."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_ACTIVE_POLL_INTERVAL,
+                    default=options.get(CONF_ACTIVE_POLL_INTERVAL, DEFAULT_ACTIVE_POLL_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                vol.Required(
+                    CONF_IDLE_POLL_INTERVAL,
+                    default=options.get(CONF_IDLE_POLL_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=15, max=3600)),
+            }),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
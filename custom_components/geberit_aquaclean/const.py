@@ -1,3 +1,13 @@
 """Constants for the Geberit AquaClean integration."""
 
 DOMAIN = "geberit_aquaclean"
+
+# Polling cadence (seconds) while the toilet is in use vs. idle
+CONF_ACTIVE_POLL_INTERVAL = "active_poll_interval"
+CONF_IDLE_POLL_INTERVAL = "idle_poll_interval"
+DEFAULT_ACTIVE_POLL_INTERVAL = 15
+DEFAULT_IDLE_POLL_INTERVAL = 60
+
+# Features discovered for a device, restored before its first connection
+FEATURE_STORAGE_VERSION = 1
+FEATURE_STORAGE_KEY_PREFIX = f"{DOMAIN}.features_"
@@ -0,0 +1,254 @@
+"""Active Bluetooth coordinator for Geberit AquaClean."""
+import asyncio
+import dataclasses
+import logging
+from operator import attrgetter
+
+from bleak.exc import BleakError
+from homeassistant.core import HomeAssistant, CoreState, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth.active_update_coordinator import ActiveBluetoothDataUpdateCoordinator
+
+from .const import DEFAULT_ACTIVE_POLL_INTERVAL, DEFAULT_IDLE_POLL_INTERVAL, DOMAIN
+from .geberit_client import DeviceState, GeberitAquaCleanClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coalesce bursts of advertisements (e.g. RSSI-only updates) into one refresh
+ADVERTISEMENT_DEBOUNCE_COOLDOWN = 0.35
+
+# DeviceState fields entities publish; the raw pushed status is not one of them
+_PUBLISHED_FIELDS = tuple(
+    field.name for field in dataclasses.fields(DeviceState) if field.name != "system_params"
+)
+_published_values = attrgetter(*_PUBLISHED_FIELDS)
+
+
+class GeberitActiveBluetoothCoordinator(ActiveBluetoothDataUpdateCoordinator):
+    """Active Bluetooth coordinator for Geberit AquaClean devices."""
+
+    def __init__(self, hass: HomeAssistant, client: GeberitAquaCleanClient, ble_device, device_name: str, base_unique_id: str):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass=hass,
+            logger=_LOGGER,
+            address=ble_device.address,
+            needs_poll_method=self._needs_poll,
+            poll_method=self._async_update,
+            mode=bluetooth.BluetoothScanningMode.ACTIVE,
+            connectable=True,
+        )
+        self.client = client
+        self.ble_device = ble_device
+        self.device_name = device_name
+        self.base_unique_id = base_unique_id
+        self._ready_future: asyncio.Future[bool] = hass.loop.create_future()
+        self._was_unavailable = True
+        self._active_poll_interval = DEFAULT_ACTIVE_POLL_INTERVAL
+        self._idle_poll_interval = DEFAULT_IDLE_POLL_INTERVAL
+        self._last_manufacturer_data: dict[int, bytes] | None = None
+        self._last_activity_ts: float | None = None
+        self._last_published: tuple | None = None
+        self._data_changed = True
+        self._device_info_signature: tuple[str, str, str, str] | None = None
+        self.device_info_dict = self._build_device_info(None)
+        self._pending_advertisement: tuple[
+            bluetooth.BluetoothServiceInfoBleak, bluetooth.BluetoothChange
+        ] | None = None
+        self._adv_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=ADVERTISEMENT_DEBOUNCE_COOLDOWN,
+            immediate=True,
+            function=self._process_advertisement,
+        )
+
+    @callback
+    def async_set_poll_intervals(self, active_interval: float, idle_interval: float) -> None:
+        """Set the poll intervals used while the device is active and idle."""
+        self._active_poll_interval = active_interval
+        # Never poll an idle device more often than an active one
+        self._idle_poll_interval = max(idle_interval, active_interval)
+
+    @callback
+    def _is_active(self, service_info: bluetooth.BluetoothServiceInfoBleak) -> bool:
+        """Return True if the device is in use or its advertisement changed recently."""
+        data = self.data
+        if data is not None and (
+            data.user_is_sitting
+            or data.anal_shower_running
+            or data.lady_shower_running
+            or data.dryer_running
+        ):
+            return True
+        return (
+            self._last_activity_ts is not None
+            and service_info.time - self._last_activity_ts < self._idle_poll_interval
+        )
+
+    @callback
+    def _needs_poll(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        seconds_since_last_poll: float | None,
+    ) -> bool:
+        """Check if we need to poll the device."""
+        if self.hass.state != CoreState.running:
+            return False
+        # Callbacks are registered as connectable, so the advertisement itself proves a
+        # connectable scanner can reach the device; losing every scanner is reported
+        # through _async_handle_unavailable instead of a registry lookup per advertisement
+        if seconds_since_last_poll is None:
+            return True
+        if seconds_since_last_poll < self._active_poll_interval:
+            return False
+        if seconds_since_last_poll >= self._idle_poll_interval:
+            return True
+        return self._is_active(service_info)
+
+    async def _async_update(self, service_info: bluetooth.BluetoothServiceInfoBleak):
+        """Poll the device for data."""
+        try:
+            state = await self.client.get_device_state()
+        except (BleakError, asyncio.TimeoutError, ConnectionError) as exception:
+            raise UpdateFailed(f"Error communicating with API: {exception}") from exception
+        # The client updates one DeviceState in place, so compare a snapshot of
+        # the published field values rather than identity
+        published = _published_values(state)
+        self._data_changed = published != self._last_published
+        self._last_published = published
+        if self._data_changed:
+            self._async_update_device_info(state)
+        return state
+
+    @callback
+    def _async_handle_bluetooth_poll(self) -> None:
+        """Handle a poll event, skipping listeners when the state is unchanged."""
+        if self._data_changed:
+            super()._async_handle_bluetooth_poll()
+
+    @callback
+    def _async_update_device_info(self, state) -> None:
+        """Rebuild the device information if the identifying fields changed."""
+        signature = (
+            state.description,
+            state.firmware_version,
+            state.serial_number,
+            state.sap_number,
+        )
+        if signature != self._device_info_signature:
+            self._device_info_signature = signature
+            self.device_info_dict = self._build_device_info(state)
+
+    def _build_device_info(self, device_data) -> DeviceInfo:
+        """Build the device information for the given device state."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.client.mac_address)},
+            name=getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
+            manufacturer="Geberit",
+            model="AquaClean",
+            sw_version=getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
+            serial_number=getattr(device_data, "serial_number", None) if device_data else None,
+            hw_version=getattr(device_data, "sap_number", None) if device_data else None,
+        )
+
+    async def async_wait_ready(self) -> bool:
+        """Wait for the device to be ready."""
+        # 30 second timeout for device readiness
+        timeout_handle = self.hass.loop.call_later(30.0, self._ready_timeout)
+        try:
+            return await self._ready_future
+        finally:
+            timeout_handle.cancel()
+
+    @callback
+    def _ready_timeout(self) -> None:
+        """Give up waiting for the first advertisement."""
+        if not self._ready_future.done():
+            self._ready_future.set_result(False)
+
+    @callback
+    def _async_handle_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Handle the device going unavailable."""
+        _LOGGER.warning("Device %s is unavailable", service_info.address)
+        self._was_unavailable = True
+        # Mark device as unavailable before the parent notifies listeners, so
+        # entities caching their state see the change
+        if hasattr(self.client, '_device_state'):
+            self.client._device_state.connected = False
+        # Entities now show the device as unavailable, so the first poll after
+        # it comes back must publish even if the polled values are unchanged
+        self._last_published = None
+        super()._async_handle_unavailable(service_info)
+
+    @callback
+    def _async_handle_bluetooth_event(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Handle a Bluetooth event (advertisement received)."""
+        self.ble_device = service_info.device
+        if not self._ready_future.done():
+            self._ready_future.set_result(True)
+        self._pending_advertisement = (service_info, change)
+        self._adv_debouncer.async_schedule_call()
+
+    @callback
+    def _process_advertisement(self) -> None:
+        """Process the most recent advertisement after debouncing."""
+        if self._pending_advertisement is None:
+            return
+        service_info, change = self._pending_advertisement
+        self._pending_advertisement = None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Bluetooth event from %s: %s", service_info.address, change)
+
+        # A changed manufacturer payload means the device state has likely changed
+        if service_info.manufacturer_data != self._last_manufacturer_data:
+            self._last_manufacturer_data = service_info.manufacturer_data
+            self._last_activity_ts = service_info.time
+
+        # The parent handler notifies all listeners, so only dispatch to it when
+        # the device comes back or a poll is due rather than on every advertisement
+        if self._was_unavailable:
+            self._was_unavailable = False
+            _LOGGER.info("Device %s is now available (RSSI: %s)", service_info.address, service_info.rssi)
+        elif not self.needs_poll(service_info):
+            return
+
+        super()._async_handle_bluetooth_event(service_info, change)
+
+    @callback
+    def _async_stop(self) -> None:
+        """Cancel pending advertisement processing and stop the callbacks."""
+        self._adv_debouncer.async_cancel()
+        self._pending_advertisement = None
+        super()._async_stop()
+
+    @callback
+    def async_apply_optimistic_state(self, **changes) -> None:
+        """Apply values a successful write is known to have set and notify entities."""
+        data = self.data
+        if data is None:
+            return
+        for name, value in changes.items():
+            setattr(data, name, value)
+        # Listeners are notified with this state now, so the next poll only
+        # publishes again if the device reports something different
+        self._last_published = _published_values(data)
+        self.async_update_listeners()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of the device data."""
+        _LOGGER.debug("Manual refresh requested for device %s", self.base_unique_id)
+        if self._last_service_info is None:
+            return
+        # Reuse the regular poll so the new state is stored and published to
+        # all entities in a single listener update
+        await self._async_poll()
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Base entity for Geberit AquaClean integration."""
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+_UID_PREFIX = "geberit_aquaclean_"
 
 
 class GeberitAquaCleanEntity(CoordinatorEntity):
@@ -13,7 +14,7 @@ class GeberitAquaCleanEntity(CoordinatorEntity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._key = key
-        self._attr_unique_id = f"geberit_aquaclean_{key}_{coordinator.client.mac_address.replace(':', '')}"
+        self._attr_unique_id = _UID_PREFIX + key + "_" + coordinator.client.mac_compact
 
     @property
     def available(self) -> bool:
@@ -26,13 +27,21 @@ class GeberitAquaCleanEntity(CoordinatorEntity):
     @property
     def device_info(self):
         """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
+        return self.coordinator.device_info_dict
+
+    @callback
+    def _update_cached_state(self) -> None:
+        """Cache the state read from the current coordinator data."""
+
+    @callback
+    def _state_signature(self) -> tuple | None:
+        """Return the values that make up the published state, or None to always write."""
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping unchanged state."""
+        previous = self._state_signature()
+        self._update_cached_state()
+        if previous is None or self._state_signature() != previous:
+            self.async_write_ha_state()
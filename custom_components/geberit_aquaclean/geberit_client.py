@@ -1,18 +1,26 @@
 """Geberit AquaClean BLE client implementation."""
 import asyncio
+from collections.abc import Callable
+from contextlib import suppress
 import logging
-import binascii
+from operator import attrgetter
+import struct
+import time
 from dataclasses import dataclass
 from typing import Optional
-from bleak import BleakClient, BleakScanner
-from bleak_retry_connector import establish_connection
+from bleak import BleakClient
+from bleak.exc import BleakError
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from .const import FEATURE_STORAGE_KEY_PREFIX, FEATURE_STORAGE_VERSION
 from .protocol import (
     GeberitProtocolSerializer,
     DeviceIdentification,
     BLEFrameCollector,
     DataPoint,
+    FRAME_HEADER_TABLE,
     SystemParameters,
     HighLevelCommand,
 )
@@ -28,10 +36,133 @@ NOTIFY_CHARACTERISTIC_UUID = "3334429d-90f3-4c41-a02d-5cb3a63e0000"  # Notify ca
 RESPONSE_TIMEOUT = 15.0
 
 # Debug mode (set to True to enable verbose logging without config changes)
-DEBUG_MODE = True
+DEBUG_MODE = False
 CONNECTION_TIMEOUT = 15.0
+# Overall budget for connect(), including connection retries and device setup
+CONNECT_DEADLINE = 60.0
 
-@dataclass
+# Data point value layouts
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+
+# High-level commands take no arguments, so their encoded frames never change
+_COMMAND_FRAMES: dict[HighLevelCommand, bytes] = {
+    command: GeberitProtocolSerializer.encode_with_cobs(
+        GeberitProtocolSerializer.create_high_level_command(command)
+    )
+    for command in HighLevelCommand
+}
+
+# The identification request reads a fixed set of data points on every connect
+_DEVICE_INFO_REQUEST_FRAME = GeberitProtocolSerializer.encode_with_cobs(
+    GeberitProtocolSerializer.create_device_info_request()
+)
+
+# The status request is sent on every poll and never changes
+_SYSTEM_STATUS_REQUEST_FRAME = GeberitProtocolSerializer.encode_with_cobs(
+    GeberitProtocolSerializer.create_system_status_request()
+)
+
+
+def _data_point_frames(data_point: DataPoint, values: range) -> dict[int, bytes]:
+    """Encode a single-byte data point write for every value in range."""
+    return {
+        value: GeberitProtocolSerializer.encode_with_cobs(
+            GeberitProtocolSerializer.create_data_point_write(data_point, _U8.pack(value))
+        )
+        for value in values
+    }
+
+
+# Setters with small value ranges reuse pre-encoded frames
+_WATER_TEMPERATURE_FRAMES = _data_point_frames(DataPoint.DP_WATER_TEMPERATURE, range(34, 41))
+_SPRAY_INTENSITY_FRAMES = _data_point_frames(DataPoint.DP_SPRAY_INTENSITY, range(1, 6))
+_SPRAY_POSITION_FRAMES = _data_point_frames(DataPoint.DP_SPRAY_POSITION, range(1, 6))
+
+# Orientation light settings (Sela only): data point, value range and encoding.
+# Ranges of the sensor settings are assumed, the device reports the real ones
+# through separate data points
+_ORIENTATION_LIGHT_SETTINGS: dict[str, tuple[int, int, int, struct.Struct]] = {
+    "brightness": (43, 0, 100, _U8),  # DP_ORIENTATION_LIGHT_SET_LED (write-only)
+    "mode": (44, 0, 2, _U8),  # DP_ORIENTATION_LIGHT_MODE
+    "sensor_dependent": (45, 0, 1, _U8),
+    "ambient_dependent": (46, 0, 1, _U8),
+    "led_override": (47, 0, 1, _U8),
+    "intensity": (48, 0, 4, _U8),  # DP_ORIENTATION_LIGHT_INTENSITY
+    "follow_up_time": (50, 0, 300, _U16),  # Seconds
+    "sensor_distance": (51, 0, 10, _U8),
+    "sensor_sensitivity": (53, 0, 10, _U8),
+    "movement_sensor": (55, 0, 1, _U8),
+    "ambient_sensitivity": (56, 0, 10, _U8),
+    "dark_threshold": (58, 0, 100, _U8),
+}
+
+# SystemParameters fields the status response actually carries, mirrored onto
+# DeviceState after each read. Settings the response does not report (water
+# temperature, spray, night light, user profile, lid, ...) are left alone, so
+# DeviceState keeps the last value written through this client
+_SYSTEM_PARAMETER_FIELDS = (
+    "user_is_sitting",
+    "anal_shower_running",
+    "lady_shower_running",
+    "dryer_running",
+    "descaling_needed",
+)
+_get_system_parameter_values = attrgetter(*_SYSTEM_PARAMETER_FIELDS)
+
+# Model detection names features after the protocol fields and device functions,
+# while the entity platforms check these names. Stores written before the mapping
+# still hold the detection names, so the mapping is applied on load as well
+_FEATURE_NAMES: dict[str, tuple[str, ...]] = {
+    "anal_shower": ("rear_wash",),
+    "lady_shower": ("lady_wash",),
+    # A motorized lid also reports its position
+    "lid_control": ("lid_control", "lid_sensor"),
+    "filter_monitoring": ("water_filter",),
+}
+
+
+def _normalize_features(features) -> dict[str, bool]:
+    """Map feature names onto the names the entity platforms check."""
+    return {
+        name: True
+        for feature in features
+        for name in _FEATURE_NAMES.get(feature, (feature,))
+    }
+
+# Concurrent state reads within this window share one BLE exchange
+STATE_CACHE_TTL = 2.0
+
+# An absolute setting re-sent with the value the device state already holds
+# from this client's last write is not written again within this window
+# (slider drags and repeated automation runs); toggles are never skipped
+SETTING_REPEAT_WINDOW = 5.0
+
+# Pending notifications kept for the receive worker before new ones are dropped
+RX_QUEUE_SIZE = 128
+
+
+def _feature_store(hass: HomeAssistant, mac_address: str) -> Store:
+    """Return the store holding the features discovered for a device."""
+    return Store(
+        hass,
+        FEATURE_STORAGE_VERSION,
+        FEATURE_STORAGE_KEY_PREFIX + mac_address.upper().replace(':', ''),
+    )
+
+
+async def async_remove_feature_cache(hass: HomeAssistant, mac_address: str) -> None:
+    """Remove the stored features of a device."""
+    await _feature_store(hass, mac_address).async_remove()
+
+
+def _property_names(char) -> set[str]:
+    """Return the lower-cased property names of a GATT characteristic."""
+    # Backends report properties either as strings or as enum-like objects
+    return {(p.name if hasattr(p, 'name') else str(p)).lower() for p in char.properties}
+
+
+@dataclass(slots=True, eq=False)
 class DeviceState:
     """Device state data."""
     # Basic status
@@ -82,88 +213,156 @@ class DeviceState:
     auto_flush: bool = True
     barrier_free_mode: bool = False
     active_user_profile: int = 1  # 1-4
+    # Last status pushed by the device between polls
+    system_params: Optional[SystemParameters] = None
 
 
 class GeberitAquaCleanClient:
     """Client for communicating with Geberit AquaClean devices via BLE."""
     
-    def __init__(self, mac_address: str, hass: HomeAssistant, scanner: Optional[BleakScanner] = None):
+    def __init__(self, mac_address: str, hass: HomeAssistant):
         """Initialize the client."""
         self.mac_address = mac_address
+        self.mac_upper = mac_address.upper()
+        self.mac_compact = mac_address.replace(':', '')
         self._hass = hass
-        self._scanner = scanner or bluetooth.async_get_scanner(hass)
         self._client: Optional[BleakClient] = None
-        self._connected = False
         self._device_identification: Optional[DeviceIdentification] = None
         self._device_state = DeviceState()
         self._frame_collector = BLEFrameCollector()
-        self._response_event = asyncio.Event()
-        self._last_response_data: Optional[bytes] = None
+        # The protocol carries no request id, so exchanges are serialized and
+        # each complete message resolves the future of the request in flight
+        self._request_lock = asyncio.Lock()
+        self._response_future: Optional[asyncio.Future[bytes]] = None
+        self._rx_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=RX_QUEUE_SIZE)
+        self._rx_task: Optional[asyncio.Task] = None
+        # State read in flight, shared by every caller that arrives meanwhile
+        self._state_read: Optional[asyncio.Task[DeviceState]] = None
+        self._write_with_response = True
+        self._state_cache_ts = 0.0
+        self._recent_settings: dict[str, float] = {}
         self.available_features = {}
+        self._feature_store = _feature_store(hass, mac_address)
+        self._features_changed_callback: Optional[Callable[[], None]] = None
         
+    @property
+    def connected(self) -> bool:
+        """Return True if the BLE link to the device is up."""
+        return self._client is not None and self._client.is_connected
+
     async def connect(self) -> bool:
         """Connect to the device using Home Assistant Bluetooth best practices."""
         try:
-            if self._client and self._client.is_connected:
-                return True
+            # One deadline covers connecting, notification setup and identification
+            async with asyncio.timeout(CONNECT_DEADLINE):
+                if self.connected:
+                    return True
                 
-            # Use Home Assistant's Bluetooth scanner (best practice)
-            ble_device = bluetooth.async_ble_device_from_address(
-                self._hass, self.mac_address.upper(), connectable=True
-            )
+                # Use Home Assistant's Bluetooth scanner (best practice)
+                ble_device = bluetooth.async_ble_device_from_address(
+                    self._hass, self.mac_upper, connectable=True
+                )
             
-            if not ble_device:
-                _LOGGER.error("Device %s not found in Bluetooth registry", self.mac_address)
-                return False
+                if not ble_device:
+                    _LOGGER.error("Device %s not found in Bluetooth registry", self.mac_address)
+                    return False
                 
-            # Use bleak-retry-connector for reliable connection (best practice)
-            self._client = await establish_connection(
-                BleakClient,
-                ble_device,
-                self.mac_address,
-                timeout=CONNECTION_TIMEOUT,
-                max_attempts=3,
-                use_services_cache=True
-            )
+                # Use bleak-retry-connector for reliable connection (best practice)
+                self._client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    self.mac_address,
+                    disconnected_callback=self._on_disconnect,
+                    timeout=CONNECTION_TIMEOUT,
+                    max_attempts=3,
+                    use_services_cache=True
+                )
             
-            if not self._client.is_connected:
-                _LOGGER.error("Failed to connect to device %s", self.mac_address)
-                self._connected = False
-                return False
-                
-            # Mark as connected before setting up notifications
-            self._connected = True
+                if not self.connected:
+                    _LOGGER.error("Failed to connect to device %s", self.mac_address)
+                    return False
+
+                await self._acquire_mtu()
+
+                # Notifications are parsed by a worker so the callback returns immediately
+                if self._rx_task is None or self._rx_task.done():
+                    self._rx_task = self._hass.async_create_background_task(
+                        self._rx_loop(), f"geberit_aquaclean rx {self.mac_address}"
+                    )
             
-            # Setup notifications
-            await self._setup_notifications()
+                # The device answers every frame with a notification, so skip the
+                # GATT-level acknowledgement when the characteristic allows it
+                write_char = self._client.services.get_characteristic(WRITE_CHARACTERISTIC_UUID)
+                self._write_with_response = (
+                    write_char is None or "write-without-response" not in write_char.properties
+                )
+
+                # Setup notifications
+                await self._setup_notifications()
             
-            # Initialize device
-            await self._initialize_device()
+                # Initialize device
+                await self._initialize_device()
             
-            _LOGGER.info("Successfully connected to device %s", self.mac_address)
-            return True
+                _LOGGER.debug("Successfully connected to device %s", self.mac_address)
+                return True
             
-        except Exception as e:
+        except TimeoutError:
+            _LOGGER.error("Timed out connecting to device %s", self.mac_address)
+        except BleakError as e:
             _LOGGER.error("Failed to connect to device %s: %s", self.mac_address, e)
-            self._client = None
-            return False
-            
+
+        # Drop a link left half set up by an aborted connect
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            with suppress(BleakError):
+                await client.disconnect()
         return False
         
+    def _on_disconnect(self, client: BleakClient) -> None:
+        """Handle the link dropping outside of disconnect()."""
+        _LOGGER.debug("Device %s disconnected", self.mac_address)
+        self._recent_settings.clear()
+        # Fail the request in flight now instead of after the response timeout
+        if self._response_future is not None and not self._response_future.done():
+            self._response_future.set_result(b'')
+
     async def disconnect(self):
         """Disconnect from the device."""
-        if self._client and self._client.is_connected:
-            try:
-                await self._client.stop_notify(NOTIFY_CHARACTERISTIC_UUID)
-            except Exception:
-                pass  # Ignore errors during cleanup
-            await self._client.disconnect()
-            self._connected = False
-            _LOGGER.info("Disconnected from Geberit AquaClean")
-        else:
-            # Ensure connection state is consistent even if client is None or not connected
-            self._connected = False
+        if self._rx_task is not None:
+            self._rx_task.cancel()
+            self._rx_task = None
+        self._recent_settings.clear()
+        while not self._rx_queue.empty():
+            self._rx_queue.get_nowait()
+        # Unblock a request still waiting for a reply that can no longer arrive;
+        # an empty reply is reported as "no response" rather than cancelling the caller
+        if self._response_future is not None and not self._response_future.done():
+            self._response_future.set_result(b'')
+        try:
+            if self.connected:
+                # A stuck backend must not hold up unloading the entry
+                with suppress(BleakError, TimeoutError):
+                    async with asyncio.timeout(1.0):
+                        await self._client.stop_notify(NOTIFY_CHARACTERISTIC_UUID)
+                # The link may drop on its own while disconnecting
+                with suppress(BleakError):
+                    await self._client.disconnect()
+                _LOGGER.debug("Disconnected from Geberit AquaClean")
+        finally:
+            self._client = None
             
+    async def _acquire_mtu(self):
+        """Negotiate a larger MTU so responses fit in fewer notifications."""
+        # Bleak only exposes MTU exchange on the BlueZ backend; other backends
+        # (including ESPHome proxies) negotiate it during connection
+        acquire_mtu = getattr(getattr(self._client, "_backend", None), "_acquire_mtu", None)
+        if acquire_mtu is not None:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                _LOGGER.debug("MTU negotiation failed for %s: %s", self.mac_address, e)
+        _LOGGER.debug("Using MTU %d for %s", self._client.mtu_size, self.mac_address)
+
     async def _setup_notifications(self):
         """Setup BLE notifications for receiving data."""
         try:
@@ -173,45 +372,25 @@ class GeberitAquaCleanClient:
                 for service in self._client.services:
                     _LOGGER.info("Service: %s (%s)", service.uuid, service.description or "Unknown")
                     for char in service.characteristics:
-                        # Handle both string and object properties
-                        props = []
-                        for p in char.properties:
-                            if hasattr(p, 'name'):
-                                props.append(p.name)
-                            else:
-                                props.append(str(p))
-                        _LOGGER.info("  Char: %s - Properties: %s", char.uuid, props)
-                        
-                        # Check for notify capability
-                        notify_capable = False
-                        for p in char.properties:
-                            prop_name = p.name if hasattr(p, 'name') else str(p)
-                            if prop_name.lower() == "notify":
-                                notify_capable = True
-                                break
-                        if notify_capable:
+                        props = _property_names(char)
+                        _LOGGER.info("  Char: %s - Properties: %s", char.uuid, sorted(props))
+                        if "notify" in props:
                             _LOGGER.info("    -> NOTIFY capable characteristic found!")
             
             if DEBUG_MODE:
-                _LOGGER.info("Attempting to setup notifications on %s", NOTIFY_CHARACTERISTIC_UUID)
+                _LOGGER.debug("Attempting to setup notifications on %s", NOTIFY_CHARACTERISTIC_UUID)
             await self._client.start_notify(NOTIFY_CHARACTERISTIC_UUID, self._handle_notification)
             _LOGGER.debug("Notifications setup successfully")
         except Exception as e:
             _LOGGER.error("Failed to setup notifications on %s: %s", NOTIFY_CHARACTERISTIC_UUID, e)
             
             # Try to find alternative notification characteristics
-            notify_chars = []
-            for service in self._client.services:
-                for char in service.characteristics:
-                    # Handle both string and object properties
-                    notify_capable = False
-                    for p in char.properties:
-                        prop_name = p.name if hasattr(p, 'name') else str(p)
-                        if prop_name.lower() == "notify":
-                            notify_capable = True
-                            break
-                    if notify_capable:
-                        notify_chars.append(str(char.uuid))
+            notify_chars = [
+                str(char.uuid)
+                for service in self._client.services
+                for char in service.characteristics
+                if "notify" in _property_names(char)
+            ]
             
             if notify_chars:
                 _LOGGER.error("Available notify characteristics: %s", notify_chars)
@@ -221,19 +400,28 @@ class GeberitAquaCleanClient:
             raise
             
     def _handle_notification(self, sender: int, data: bytes):
-        """Handle incoming BLE notifications with improved error handling."""
+        """Queue incoming BLE notifications for the receive worker."""
+        try:
+            self._rx_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            _LOGGER.warning("Notification queue full, dropping notification from %s", sender)
+
+    async def _rx_loop(self):
+        """Process queued notifications until cancelled."""
+        while True:
+            data = await self._rx_queue.get()
+            self._process_notification(data)
+
+    def _process_notification(self, data: bytes):
+        """Parse a BLE notification with improved error handling."""
+        sender = NOTIFY_CHARACTERISTIC_UUID
         try:
-            hex_data = binascii.hexlify(data).decode('ascii')
             if DEBUG_MODE:
-                _LOGGER.info("Received notification from %s: %s (length: %d)", sender, hex_data, len(data))
+                _LOGGER.info("Received notification from %s: %s (length: %d)", sender, data.hex(), len(data))
 
                 # Decode frame header according to Geberit protocol documentation
                 if len(data) > 1:
-                    header = data[0]
-                    frame_id = (header >> 5) & 0x07  # Bits 7-5
-                    msg_type_present = (header >> 4) & 0x01  # Bit 4
-                    transaction = (header >> 1) & 0x07  # Bits 3-1
-                    flags = header & 0x01  # Bit 0
+                    frame_id, msg_type_present, transaction, flags = FRAME_HEADER_TABLE[data[0]]
 
                     _LOGGER.info("Frame Header Analysis: ID=%d, MsgType=%d, Trans=%d, Flags=%d",
                                 frame_id, msg_type_present, transaction, flags)
@@ -252,10 +440,11 @@ class GeberitAquaCleanClient:
                     if self._frame_collector.add_frame(frame):
                         message_data = self._frame_collector.get_complete_message()
                         if message_data:
-                            _LOGGER.debug("Complete message assembled: %s",
-                                         binascii.hexlify(message_data).decode('ascii'))
-                            self._last_response_data = message_data
-                            self._response_event.set()
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug("Complete message assembled: %s", message_data.hex())
+                            future = self._response_future
+                            if future is not None and not future.done():
+                                future.set_result(message_data)
 
                             # Parse status notifications for live updates with error handling
                             try:
@@ -269,28 +458,60 @@ class GeberitAquaCleanClient:
                 except Exception as collector_error:
                     _LOGGER.warning("Error processing frame collector: %s", collector_error)
             else:
-                _LOGGER.warning("Failed to decode frame from notification data: %s", hex_data)
+                _LOGGER.warning("Failed to decode frame from notification data: %s", data.hex())
                 _LOGGER.debug("Raw data analysis: first_byte=0x%02x, last_byte=0x%02x",
                              data[0] if data else 0, data[-1] if data else 0)
 
-        except Exception as e:
-            _LOGGER.error("Error handling notification: %s", e)
-            if DEBUG_MODE:
-                _LOGGER.debug("Exception occurred with data: %s", binascii.hexlify(data).decode('ascii') if data else "None")
+        except Exception:
+            _LOGGER.exception("Error handling notification")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Exception occurred with data: %s", data.hex() if data else "None")
             
+    @callback
+    def async_on_features_changed(self, features_changed: Callable[[], None]) -> None:
+        """Register a callback for identified features that differ from the restored ones."""
+        self._features_changed_callback = features_changed
+
+    async def async_load_features(self):
+        """Restore the features discovered on a previous connection."""
+        stored = await self._feature_store.async_load()
+        if stored:
+            self.available_features = _normalize_features(stored["features"])
+            _LOGGER.debug("Restored features for SAP %s: %s", stored["sap_number"], stored["features"])
+
     async def _initialize_device(self):
         """Initialize device and read basic information."""
         try:
+            # The identification does not change between reconnects, so it is only
+            # read until it succeeds once
+            if self._device_identification is not None:
+                return
+
             # Read device identification and discover features
             await self._read_device_identification()
+            if self._device_identification is None and self.available_features:
+                # Keep the restored features rather than falling back to defaults
+                return
+            restored_features = set(self.get_available_features())
             await self._discover_device_features()
+
+            if self._device_identification is not None:
+                features = self.get_available_features()
+                await self._feature_store.async_save({
+                    "sap_number": self._device_identification.sap_number,
+                    "features": features,
+                })
+                # Platforms created their entities from the restored features,
+                # which are empty on a first install
+                if set(features) != restored_features and self._features_changed_callback is not None:
+                    self._features_changed_callback()
             
         except Exception as e:
             _LOGGER.error("Failed to initialize device: %s", e)
             
     async def _discover_device_features(self):
         """Discover which features are available on this device model."""
-        _LOGGER.info("Starting model-based feature discovery")
+        _LOGGER.debug("Starting model-based feature discovery")
         
         # Get device identification info
         sap_number = None
@@ -299,7 +520,7 @@ class GeberitAquaCleanClient:
             sap_number = self._device_identification.sap_number
             device_id = getattr(self._device_identification, 'device_id', None)
             
-        _LOGGER.info("Determining features for SAP: %s, Device ID: %s", sap_number, device_id)
+        _LOGGER.debug("Determining features for SAP: %s, Device ID: %s", sap_number, device_id)
         
         # Since device doesn't respond to data point reads, use model-based detection
         # All AquaClean models have these basic features
@@ -319,20 +540,18 @@ class GeberitAquaCleanClient:
         if hasattr(self, '_device_identification') and self._device_identification and self._device_identification.sap_number:
             features = self._determine_features_from_sap_number(self._device_identification.sap_number)
             
-            # Reset features and apply model-based detection
-            self.available_features.clear()
-            for feature in features:
-                self.available_features[feature] = True
+            # Replace the defaults with the model-based detection
+            self.available_features = _normalize_features(features)
                 
         available_list = [name for name, available in self.available_features.items() if available]
         _LOGGER.info("✅ Model-based feature detection complete. Available features: %s", 
                     sorted(available_list))
         
         # Log feature summary for debugging
-        _LOGGER.info("Feature discovery summary:")
-        _LOGGER.info("  - Total features available: %d", len(available_list))
+        _LOGGER.debug("Feature discovery summary:")
+        _LOGGER.debug("  - Total features available: %d", len(available_list))
         if device_id and device_id.sap_number:
-            _LOGGER.info("  - Model detection based on SAP: %s", device_id.sap_number)
+            _LOGGER.debug("  - Model detection based on SAP: %s", device_id.sap_number)
         else:
             _LOGGER.warning("  - No SAP number available, using default feature set")
                     
@@ -348,7 +567,6 @@ class GeberitAquaCleanClient:
         features.update([
             'user_detection',           # User presence sensor
             'lid_control',             # Lid open/close
-            'orientation_light',       # Basic orientation lighting
             'water_temperature',       # Water temperature control
             'seat_heating',           # Seat heating
             'power_management'        # Basic power status
@@ -361,7 +579,7 @@ class GeberitAquaCleanClient:
             # Convert to int for range checks
             try:
                 sap_int = int(sap_numeric)
-                _LOGGER.info("Processing SAP number: %s -> %d", sap_number, sap_int)
+                _LOGGER.debug("Processing SAP number: %s -> %d", sap_number, sap_int)
                 
                 # Handle various SAP number formats
                 # Sela models (high-end): SAP 5168+ or 146.016+
@@ -372,6 +590,7 @@ class GeberitAquaCleanClient:
                         'anal_shower',        # Rear wash  
                         'dryer',              # Warm air dryer
                         'night_light',        # RGB night light
+                        'orientation_light',  # Orientation light (Sela only)
                         'mood_lighting',      # Advanced lighting controls
                         'spray_intensity',    # Adjustable spray pressure
                         'spray_position',     # Spray positioning
@@ -420,7 +639,7 @@ class GeberitAquaCleanClient:
                 _LOGGER.warning("Could not parse SAP number for feature detection: %s", sap_number)
         
         # If no specific model match, assume basic feature set
-        if len(features) <= 6:  # Only base features
+        if len(features) <= 5:  # Only base features
             _LOGGER.info("Unknown model, assuming basic AquaClean features")
             features.update(['lady_shower', 'anal_shower', 'basic_controls'])
             
@@ -436,241 +655,122 @@ class GeberitAquaCleanClient:
         
     async def set_night_light_state(self, state: bool) -> bool:
         """Turn night light on or off using brightness control."""
-        try:
-            # Turn on/off by setting brightness to 100% or 0%
+        # Turn on/off by setting brightness to 100% or 0%
+        return await self.set_night_light_brightness(100 if state else 0)
+
+    async def set_night_light(
+        self,
+        state: Optional[bool] = None,
+        brightness: Optional[int] = None,
+        rgb: Optional[tuple[int, int, int]] = None,
+    ) -> bool:
+        """Apply night light state, brightness and color with as few writes as possible."""
+        # The state is expressed through brightness, so an explicit brightness
+        # replaces the 100%/0% write that switching on or off would send
+        if brightness is None and state is not None:
             brightness = 100 if state else 0
-            return await self.set_night_light_brightness(brightness)
-        except Exception as e:
-            _LOGGER.error("Failed to set night light state to %s: %s", state, e)
-            return False
+        success = True
+        if brightness is not None:
+            success = await self.set_night_light_brightness(brightness)
+        if rgb is not None and success:
+            success = await self.set_night_light_color(*rgb)
+        return success
             
     async def set_night_light_brightness(self, brightness: int) -> bool:
         """Set night light brightness (0-100%) using official data point 340."""
-        try:
-            # Clamp brightness to valid range
-            brightness = max(0, min(100, brightness))
-            
-            # Use data point 340: DP_LIGHTING_SET_BRIGHTNESS (Write-Only, All Models)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(340, brightness)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set night light brightness to %d: %s", brightness, e)
-            return False
+        # Clamp brightness to valid range
+        brightness = 0 if brightness < 0 else 100 if brightness > 100 else brightness
+        
+        # Use data point 340: DP_LIGHTING_SET_BRIGHTNESS (Write-Only, All Models)
+        return await self._write_data_point(340, _U8.pack(brightness))
             
     async def set_night_light_color(self, red: int, green: int, blue: int) -> bool:
         """Set night light RGB color using official data point 382."""
-        try:
-            # Clamp color values to valid range
-            red = max(0, min(255, red))
-            green = max(0, min(255, green))
-            blue = max(0, min(255, blue))
-            
-            # Convert RGB to 24-bit color value (0-16777215)
-            # Format: 0xRRGGBB
-            color_value = (red << 16) | (green << 8) | blue
-            
-            # Use data point 382: DP_LED_COLOR (Read/Write, All Models)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(382, color_value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set night light color to RGB(%d,%d,%d): %s", red, green, blue, e)
-            return False
+        # Clamp color values to valid range
+        red = 0 if red < 0 else 255 if red > 255 else red
+        green = 0 if green < 0 else 255 if green > 255 else green
+        blue = 0 if blue < 0 else 255 if blue > 255 else blue
+        
+        # Use data point 382: DP_LED_COLOR (Read/Write, All Models)
+        # 24-bit color value, sent as 0xRRGGBB
+        return await self._write_data_point(382, bytes((red, green, blue)))
             
     async def set_orientation_light_state(self, state: bool) -> bool:
         """Turn orientation light on or off using brightness control (Sela only)."""
-        try:
-            # Turn on/off by setting brightness to 100% or 0%
-            brightness = 100 if state else 0
-            return await self.set_orientation_light_brightness(brightness)
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light state to %s: %s", state, e)
-            return False
-            
+        # Turn on/off by setting brightness to 100% or 0%
+        return await self.set_orientation_light_brightness(100 if state else 0)
+
+    async def set_orientation_light_setting(self, name: str, value: int) -> bool:
+        """Write an orientation light setting (Sela only), clamped to its valid range."""
+        data_point_id, low, high, layout = _ORIENTATION_LIGHT_SETTINGS[name]
+        value = int(value)
+        value = low if value < low else high if value > high else value
+        return await self._write_data_point(data_point_id, layout.pack(value))
+
     async def set_orientation_light_brightness(self, brightness: int) -> bool:
-        """Set orientation light brightness (0-100%) using data point 43 (Sela only)."""
-        try:
-            # Clamp brightness to valid range
-            brightness = max(0, min(100, brightness))
-            
-            # Use data point 43: DP_ORIENTATION_LIGHT_SET_LED (Write-Only, Sela Only)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(43, brightness)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light brightness to %d: %s", brightness, e)
-            return False
-            
+        """Set orientation light brightness (0-100%, Sela only)."""
+        return await self.set_orientation_light_setting("brightness", brightness)
+
     async def set_orientation_light_mode(self, mode: int) -> bool:
-        """Set orientation light mode (0-2) using data point 44 (Sela only)."""
-        try:
-            # Clamp mode to valid range (0-2)
-            mode = max(0, min(2, mode))
-            
-            # Use data point 44: DP_ORIENTATION_LIGHT_MODE (Read/Write, Sela Only)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(44, mode)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light mode to %d: %s", mode, e)
-            return False
-            
+        """Set orientation light mode (0-2, Sela only)."""
+        return await self.set_orientation_light_setting("mode", mode)
+
     async def set_orientation_light_intensity(self, intensity: int) -> bool:
-        """Set orientation light intensity (0-4) using data point 48 (Sela only)."""
-        try:
-            # Clamp intensity to valid range (0-4)
-            intensity = max(0, min(4, intensity))
-            
-            # Use data point 48: DP_ORIENTATION_LIGHT_INTENSITY (Read/Write, Sela Only)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(48, intensity)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light intensity to %d: %s", intensity, e)
-            return False
-            
+        """Set orientation light intensity (0-4, Sela only)."""
+        return await self.set_orientation_light_setting("intensity", intensity)
+
     async def set_orientation_light_sensor_dependent(self, enabled: bool) -> bool:
-        """Enable/disable sensor-dependent activation (data point 45, Sela only)."""
-        try:
-            value = 1 if enabled else 0
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(45, value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light sensor dependent to %s: %s", enabled, e)
-            return False
-            
+        """Enable/disable sensor-dependent activation (Sela only)."""
+        return await self.set_orientation_light_setting("sensor_dependent", enabled)
+
     async def set_orientation_light_ambient_dependent(self, enabled: bool) -> bool:
-        """Enable/disable ambient light-dependent activation (data point 46, Sela only)."""
-        try:
-            value = 1 if enabled else 0
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(46, value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light ambient dependent to %s: %s", enabled, e)
-            return False
-            
+        """Enable/disable ambient light-dependent activation (Sela only)."""
+        return await self.set_orientation_light_setting("ambient_dependent", enabled)
+
     async def set_orientation_light_led_override(self, enabled: bool) -> bool:
-        """Enable/disable LED override control (data point 47, Sela only)."""
-        try:
-            value = 1 if enabled else 0
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(47, value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light LED override to %s: %s", enabled, e)
-            return False
-            
+        """Enable/disable LED override control (Sela only)."""
+        return await self.set_orientation_light_setting("led_override", enabled)
+
     async def set_orientation_light_follow_up_time(self, seconds: int) -> bool:
-        """Set follow-up time in seconds (data point 50, Sela only)."""
-        try:
-            # Clamp to reasonable range
-            seconds = max(0, min(300, seconds))  # 0-300 seconds (5 minutes max)
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(50, seconds)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light follow-up time to %d: %s", seconds, e)
-            return False
-            
+        """Set follow-up time in seconds (0-300, Sela only)."""
+        return await self.set_orientation_light_setting("follow_up_time", seconds)
+
     async def set_orientation_light_sensor_distance(self, distance: int) -> bool:
-        """Set sensor distance setting (data point 51, Sela only)."""
-        try:
-            # Distance setting - check valid range dynamically via data point 52 if needed
-            distance = max(0, min(10, distance))  # Assume 0-10 range
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(51, distance)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light sensor distance to %d: %s", distance, e)
-            return False
-            
+        """Set sensor distance setting (Sela only)."""
+        return await self.set_orientation_light_setting("sensor_distance", distance)
+
     async def set_orientation_light_sensor_sensitivity(self, sensitivity: int) -> bool:
-        """Set sensor sensitivity (data point 53, Sela only)."""
-        try:
-            # Sensitivity setting - check valid range dynamically via data point 54 if needed
-            sensitivity = max(0, min(10, sensitivity))  # Assume 0-10 range
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(53, sensitivity)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light sensor sensitivity to %d: %s", sensitivity, e)
-            return False
-            
+        """Set sensor sensitivity (Sela only)."""
+        return await self.set_orientation_light_setting("sensor_sensitivity", sensitivity)
+
     async def set_orientation_light_movement_sensor(self, enabled: bool) -> bool:
-        """Enable/disable movement sensor control (data point 55, Sela only)."""
-        try:
-            value = 1 if enabled else 0
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(55, value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light movement sensor to %s: %s", enabled, e)
-            return False
-            
+        """Enable/disable movement sensor control (Sela only)."""
+        return await self.set_orientation_light_setting("movement_sensor", enabled)
+
     async def set_orientation_light_ambient_sensitivity(self, sensitivity: int) -> bool:
-        """Set ambient light sensitivity (data point 56, Sela only)."""
-        try:
-            # Ambient sensitivity - check valid range dynamically via data point 57 if needed
-            sensitivity = max(0, min(10, sensitivity))  # Assume 0-10 range
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(56, sensitivity)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light ambient sensitivity to %d: %s", sensitivity, e)
-            return False
-            
+        """Set ambient light sensitivity (Sela only)."""
+        return await self.set_orientation_light_setting("ambient_sensitivity", sensitivity)
+
     async def set_orientation_light_dark_threshold(self, threshold: int) -> bool:
-        """Set dark threshold setting (data point 58, Sela only)."""
-        try:
-            # Dark threshold - clamp to reasonable range
-            threshold = max(0, min(100, threshold))  # 0-100 range
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(58, threshold)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to set orientation light dark threshold to %d: %s", threshold, e)
-            return False
+        """Set dark threshold setting (0-100, Sela only)."""
+        return await self.set_orientation_light_setting("dark_threshold", threshold)
         
-    async def _write_data_point(self, data_point_id: int, value: int) -> bool:
-        """Write a value to a specific data point."""
-        try:
-            write_request = GeberitProtocolSerializer.create_write_data_point_request(data_point_id, value)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            return response_data is not None
-        except Exception as e:
-            _LOGGER.error("Failed to write data point %d with value %d: %s", data_point_id, value, e)
-            return False
+    async def _write_data_point(self, data_point_id: int, value: bytes) -> bool:
+        """Write an encoded value to a specific data point."""
+        write_request = GeberitProtocolSerializer.create_write_data_point_request(data_point_id, value)
+        frame_data = GeberitProtocolSerializer.encode_with_cobs(write_request)
+        return await self._send_frame(frame_data, f"write data point {data_point_id}")
         
     async def _read_device_identification(self):
         """Read device identification data."""
         try:
-            if self._client and self._client.is_connected:
+            if self.connected:
                 # Send device identification request using protocol
-                request_frame = GeberitProtocolSerializer.create_device_info_request()
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(request_frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
+                response_data = await self._send_frame_and_wait_response(_DEVICE_INFO_REQUEST_FRAME)
                 device_info = GeberitProtocolSerializer.parse_device_info_response(response_data)
                 
                 if device_info:
-                    _LOGGER.info("Device identification: %s (S/N: %s, SAP: %s)", 
+                    _LOGGER.debug("Device identification: %s (S/N: %s, SAP: %s)", 
                                device_info.description or "Unknown", 
                                device_info.serial_number or "Unknown",
                                device_info.sap_number or "Unknown")
@@ -693,72 +793,103 @@ class GeberitAquaCleanClient:
     
     async def _send_frame_and_wait_response(self, frame_data: bytes, timeout: float = RESPONSE_TIMEOUT, retries: int = 2) -> bytes:
         """Send a frame and wait for response with retry logic for transient failures."""
-        if not self._client or not self._client.is_connected:
+        if not self.connected:
             raise RuntimeError("Client not connected")
 
-        for attempt in range(retries + 1):
-            try:
-                self._last_response_data = None
-                self._response_event.clear()
+        # Any exchange may change device state, so the next read must hit the device
+        self._state_cache_ts = 0.0
 
-                # Send the frame
-                await self._client.write_gatt_char(WRITE_CHARACTERISTIC_UUID, frame_data)
-                _LOGGER.debug("Sent frame (attempt %d/%d): %s", attempt + 1, retries + 1,
-                             binascii.hexlify(frame_data).decode('ascii'))
-
-                # Wait for response
+        async with self._request_lock:
+            for attempt in range(retries + 1):
+                future: asyncio.Future[bytes] = self._hass.loop.create_future()
+                self._response_future = future
                 try:
-                    await asyncio.wait_for(self._response_event.wait(), timeout=timeout)
-                    if self._last_response_data:
-                        return self._last_response_data
-                    else:
+                    # Send the frame
+                    await self._client.write_gatt_char(
+                        WRITE_CHARACTERISTIC_UUID, frame_data, response=self._write_with_response
+                    )
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug("Sent frame (attempt %d/%d): %s", attempt + 1, retries + 1,
+                                     frame_data.hex())
+
+                    # Wait for response
+                    try:
+                        async with asyncio.timeout(timeout):
+                            return await future
+                    except TimeoutError:
+                        if not self._write_with_response:
+                            # The write may have been dropped without a GATT
+                            # acknowledgement, so confirm writes from now on
+                            _LOGGER.debug("No response to unacknowledged write, using write with response")
+                            self._write_with_response = True
                         if attempt < retries:
-                            _LOGGER.debug("Received event but no response data, retrying...")
-                            await asyncio.sleep(0.5)  # Brief pause before retry
+                            _LOGGER.debug("Timeout waiting for response (attempt %d/%d), retrying...",
+                                         attempt + 1, retries + 1)
+                            await asyncio.sleep(1.0)  # Longer pause before retry
                             continue
-                        _LOGGER.debug("Received event but no response data after all retries")
+                        _LOGGER.debug("Timeout waiting for response after %s seconds and %d retries",
+                                     timeout, retries)
                         return b''
-                except asyncio.TimeoutError:
+
+                except Exception as e:
                     if attempt < retries:
-                        _LOGGER.debug("Timeout waiting for response (attempt %d/%d), retrying...",
-                                     attempt + 1, retries + 1)
-                        await asyncio.sleep(1.0)  # Longer pause before retry
+                        _LOGGER.warning("Error sending frame (attempt %d/%d): %s, retrying...",
+                                       attempt + 1, retries + 1, e)
+                        await asyncio.sleep(0.5)
                         continue
-                    _LOGGER.debug("Timeout waiting for response after %s seconds and %d retries",
-                                 timeout, retries)
+                    _LOGGER.error("Failed to send frame after %d retries: %s", retries + 1, e)
                     return b''
-
-            except Exception as e:
-                if attempt < retries:
-                    _LOGGER.warning("Error sending frame (attempt %d/%d): %s, retrying...",
-                                   attempt + 1, retries + 1, e)
-                    await asyncio.sleep(0.5)
-                    continue
-                _LOGGER.error("Failed to send frame after %d retries: %s", retries + 1, e)
-                return b''
+                finally:
+                    self._response_future = None
 
         return b''
 
     async def get_device_state(self) -> DeviceState:
-        """Get current device state with retry logic for transient connection issues."""
+        """Get current device state, sharing recent and in-flight reads between callers."""
+        if self._state_read is None:
+            if (
+                self._device_state.connected
+                and time.monotonic() - self._state_cache_ts < STATE_CACHE_TTL
+            ):
+                return self._device_state
+            self._state_read = self._hass.async_create_background_task(
+                self._async_read_device_state(),
+                f"geberit_aquaclean state read {self.mac_address}",
+            )
+            self._state_read.add_done_callback(self._clear_state_read)
+        # Shield the shared read so one cancelled caller does not abort it for the rest
+        return await asyncio.shield(self._state_read)
+
+    def _clear_state_read(self, task: asyncio.Task) -> None:
+        """Forget a finished state read so the next caller starts a new one."""
+        if self._state_read is task:
+            self._state_read = None
+        # Every waiter may have been cancelled, so retrieve a failure here to
+        # keep it from being reported as never retrieved
+        if not task.cancelled() and (err := task.exception()) is not None:
+            _LOGGER.debug("State read for %s failed: %s", self.mac_address, err)
+
+    async def _async_read_device_state(self) -> DeviceState:
+        """Read device state with retry logic for transient connection issues."""
         # Retry connection up to 2 times if not connected
-        connection_retries = 2 if not self._connected else 0
+        connection_retries = 2
 
         for attempt in range(connection_retries + 1):
-            if not self._connected or not self._client or not self._client.is_connected:
-                if not await self.connect():
-                    self._device_state.connected = False
-                    if attempt < connection_retries:
-                        _LOGGER.debug("Failed to connect (attempt %d/%d), retrying...",
-                                     attempt + 1, connection_retries + 1)
-                        await asyncio.sleep(1.0)
-                        continue
-                    return self._device_state
+            if await self._ensure_connected():
+                break
+            self._device_state.connected = False
+            if attempt < connection_retries:
+                _LOGGER.debug("Failed to connect (attempt %d/%d), retrying...",
+                             attempt + 1, connection_retries + 1)
+                await asyncio.sleep(1.0)
+                continue
+            return self._device_state
 
         try:
             # Read system parameters using the protocol with retry
             await self._read_system_parameters()
             self._device_state.connected = True
+            self._state_cache_ts = time.monotonic()
 
         except Exception as e:
             _LOGGER.error("Failed to get device state: %s", e)
@@ -769,433 +900,179 @@ class GeberitAquaCleanClient:
     async def _read_system_parameters(self):
         """Read system parameters from device."""
         try:
-            if self._client and self._client.is_connected:
-                # Send system parameter list request using protocol
-                request_frame = GeberitProtocolSerializer.create_system_status_request()
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(request_frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                system_params = GeberitProtocolSerializer.parse_system_status_response(response_data)
+            # The caller has just ensured the connection and the send helper
+            # raises if it dropped since, so no separate check is needed here
+            response_data = await self._send_frame_and_wait_response(_SYSTEM_STATUS_REQUEST_FRAME)
+            system_params = GeberitProtocolSerializer.parse_system_status_response(response_data)
+            
+            # Update device state from system parameters
+            if system_params:
+                # DeviceState uses slots, so copy through one attrgetter call
+                # rather than a __dict__ update
+                device_state = self._device_state
+                for field, value in zip(
+                    _SYSTEM_PARAMETER_FIELDS, _get_system_parameter_values(system_params)
+                ):
+                    setattr(device_state, field, value)
                 
-                # Update device state from system parameters
-                if system_params:
-                    self._device_state.user_is_sitting = system_params.user_is_sitting
-                    self._device_state.anal_shower_running = system_params.anal_shower_running
-                    self._device_state.lady_shower_running = system_params.lady_shower_running
-                    self._device_state.dryer_running = system_params.dryer_running
-                    self._device_state.lid_position = system_params.lid_position
-                    # Temperature and comfort
-                    self._device_state.water_temperature = system_params.water_temperature
-                    self._device_state.seat_heating = system_params.seat_heating
-                    self._device_state.night_light = system_params.night_light
-                    # Spray controls
-                    self._device_state.spray_intensity = system_params.spray_intensity
-                    self._device_state.spray_position = system_params.spray_position
-                    self._device_state.oscillating_spray = system_params.oscillating_spray
-                    # Maintenance
-                    self._device_state.descaling_needed = system_params.descaling_needed
-                    self._device_state.filter_replacement_needed = system_params.filter_replacement_needed
-                    self._device_state.power_consumption = system_params.power_consumption
-                    self._device_state.water_pressure = system_params.water_pressure
-                    # Advanced features
-                    self._device_state.auto_flush = system_params.auto_flush
-                    self._device_state.barrier_free_mode = system_params.barrier_free_mode
-                    self._device_state.active_user_profile = system_params.active_user_profile
-                    
-                    _LOGGER.debug("Updated system parameters: sitting=%s, anal_shower=%s, lady_shower=%s, dryer=%s, lid=%s",
-                                system_params.user_is_sitting,
-                                system_params.anal_shower_running,
-                                system_params.lady_shower_running,
-                                system_params.dryer_running,
-                                system_params.lid_position)
-                else:
-                    _LOGGER.warning("No response received for system parameter request")
+                _LOGGER.debug("Updated system parameters: sitting=%s, anal_shower=%s, lady_shower=%s, dryer=%s, lid=%s",
+                            system_params.user_is_sitting,
+                            system_params.anal_shower_running,
+                            system_params.lady_shower_running,
+                            system_params.dryer_running,
+                            system_params.lid_position)
+            else:
+                _LOGGER.warning("No response received for system parameter request")
             
         except Exception as e:
             _LOGGER.error("Failed to read system parameters: %s", e)
             
+    async def _ensure_connected(self) -> bool:
+        """Return True once the client is connected, connecting if needed."""
+        if self.connected:
+            return True
+        return await self.connect()
+
     async def toggle_lid_position(self) -> bool:
         """Toggle the lid position."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
+        if not await self._send_command(HighLevelCommand.TOGGLE_LID_POSITION, "toggle lid position"):
+            return False
+        # Command sent successfully, update state optimistically
+        self._device_state.lid_position = not self._device_state.lid_position
+        _LOGGER.debug("Toggled lid position to %s", self._device_state.lid_position)
+        return True
+
+    async def _send_command(self, command: HighLevelCommand, action: str) -> bool:
+        """Send a pre-encoded high-level command, connecting first if needed."""
+        return await self._send_frame(_COMMAND_FRAMES[command], action)
+
+    async def _send_frame(self, frame_data: bytes, action: str) -> bool:
+        """Send an encoded frame, connecting first if needed, and report whether it was answered."""
+        if not await self._ensure_connected():
+            return False
+
         try:
-            # Send lid toggle command using protocol
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_LID)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
             response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                # Command sent successfully, update state optimistically
-                self._device_state.lid_position = not self._device_state.lid_position
-                _LOGGER.info("Toggled lid position to %s", self._device_state.lid_position)
-                return True
-            else:
-                _LOGGER.warning("No response received for lid toggle command")
-                return False
-            
         except Exception as e:
-            _LOGGER.error("Failed to toggle lid position: %s", e)
+            _LOGGER.error("Failed to %s: %s", action, e)
+            return False
+
+        if not response_data:
+            _LOGGER.warning("No response received for %s command", action)
             return False
+        _LOGGER.debug("Sent %s command", action)
+        return True
     
+    async def _send_setting(self, field: str, value: int, frame_data: bytes) -> bool:
+        """Write an absolute setting unless the device state already expects its value.
+
+        Only for idempotent settings: the write is skipped when this client
+        wrote the same value moments ago and nothing has changed the state since.
+        """
+        action = f"set {field.replace('_', ' ')}"
+        written_at = self._recent_settings.get(field)
+        if (
+            written_at is not None
+            and getattr(self._device_state, field) == value
+            and time.monotonic() - written_at < SETTING_REPEAT_WINDOW
+        ):
+            _LOGGER.debug("Skipping %s, device state already holds %s", action, value)
+            return True
+        if not await self._send_frame(frame_data, action):
+            self._recent_settings.pop(field, None)
+            return False
+        setattr(self._device_state, field, value)
+        self._recent_settings[field] = time.monotonic()
+        return True
+
     async def start_rear_wash(self) -> bool:
         """Start rear wash function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_ANAL_SHOWER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Started rear wash")
-                return True
-            else:
-                _LOGGER.warning("No response received for rear wash start command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to start rear wash: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_ANAL_SHOWER, "start rear wash")
     
     async def stop_rear_wash(self) -> bool:
         """Stop rear wash function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_ANAL_SHOWER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Stopped rear wash")
-                return True
-            else:
-                _LOGGER.warning("No response received for rear wash stop command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to stop rear wash: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_ANAL_SHOWER, "stop rear wash")
     
     async def start_front_wash(self) -> bool:
         """Start front wash function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_LADY_SHOWER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Started front wash")
-                return True
-            else:
-                _LOGGER.warning("No response received for front wash start command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to start front wash: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_LADY_SHOWER, "start front wash")
     
     async def stop_front_wash(self) -> bool:
         """Stop front wash function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_LADY_SHOWER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Stopped front wash")
-                return True
-            else:
-                _LOGGER.warning("No response received for front wash stop command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to stop front wash: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_LADY_SHOWER, "stop front wash")
     
     async def start_dryer(self) -> bool:
         """Start dryer function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_DRYER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Started dryer")
-                return True
-            else:
-                _LOGGER.warning("No response received for dryer start command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to start dryer: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_DRYER, "start dryer")
     
     async def stop_dryer(self) -> bool:
         """Stop dryer function."""
-        if not self._connected or not self._client or not self._client.is_connected:
-            if not await self.connect():
-                return False
-                
-        try:
-            frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_DRYER)
-            frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-            response_data = await self._send_frame_and_wait_response(frame_data)
-            
-            if response_data:
-                _LOGGER.info("Stopped dryer")
-                return True
-            else:
-                _LOGGER.warning("No response received for dryer stop command")
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Failed to stop dryer: %s", e)
-            return False
+        return await self._send_command(HighLevelCommand.TOGGLE_DRYER, "stop dryer")
     
     async def toggle_dryer(self) -> bool:
         """Toggle dryer state."""
-        try:
-            if self._client and self._client.is_connected:
-                # Send dryer toggle command using protocol
-                frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_DRYER)
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Dryer toggle command sent successfully")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for dryer toggle command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle dryer: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle dryer: %s", ex)
-            return False
-
+        return await self._send_command(HighLevelCommand.TOGGLE_DRYER, "toggle dryer")
+    
     async def set_water_temperature(self, temperature: int) -> bool:
         """Set water temperature (34-40°C)."""
-        try:
-            if not 34 <= temperature <= 40:
-                _LOGGER.error("Invalid temperature: %s (must be 34-40°C)", temperature)
-                return False
-                
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_WATER_TEMPERATURE, bytes([temperature]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Water temperature set to %s°C", temperature)
-                    return True
-                else:
-                    _LOGGER.warning("No response received for water temperature command")
-                    return False
-            else:
-                _LOGGER.error("Cannot set water temperature: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to set water temperature: %s", ex)
+        if temperature not in _WATER_TEMPERATURE_FRAMES:
+            _LOGGER.error("Invalid temperature: %s (must be 34-40°C)", temperature)
             return False
+        return await self._send_setting(
+            "water_temperature", temperature, _WATER_TEMPERATURE_FRAMES[temperature]
+        )
 
     async def set_spray_intensity(self, intensity: int) -> bool:
         """Set spray intensity (1-5)."""
-        try:
-            if not 1 <= intensity <= 5:
-                _LOGGER.error("Invalid spray intensity: %s (must be 1-5)", intensity)
-                return False
-                
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_SPRAY_INTENSITY, bytes([intensity]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Spray intensity set to %s", intensity)
-                    return True
-                else:
-                    _LOGGER.warning("No response received for spray intensity command")
-                    return False
-            else:
-                _LOGGER.error("Cannot set spray intensity: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to set spray intensity: %s", ex)
+        if intensity not in _SPRAY_INTENSITY_FRAMES:
+            _LOGGER.error("Invalid spray intensity: %s (must be 1-5)", intensity)
             return False
+        return await self._send_setting(
+            "spray_intensity", intensity, _SPRAY_INTENSITY_FRAMES[intensity]
+        )
 
     async def set_spray_position(self, position: int) -> bool:
         """Set spray position (1-5)."""
-        try:
-            if not 1 <= position <= 5:
-                _LOGGER.error("Invalid spray position: %s (must be 1-5)", position)
-                return False
-                
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_SPRAY_POSITION, bytes([position]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Spray position set to %s", position)
-                    return True
-                else:
-                    _LOGGER.warning("No response received for spray position command")
-                    return False
-            else:
-                _LOGGER.error("Cannot set spray position: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to set spray position: %s", ex)
+        if position not in _SPRAY_POSITION_FRAMES:
+            _LOGGER.error("Invalid spray position: %s (must be 1-5)", position)
             return False
+        return await self._send_setting(
+            "spray_position", position, _SPRAY_POSITION_FRAMES[position]
+        )
 
     async def set_user_profile(self, profile: int) -> bool:
         """Set active user profile (1-4)."""
-        try:
-            if not 1 <= profile <= 4:
-                _LOGGER.error("Invalid user profile: %s (must be 1-4)", profile)
-                return False
-                
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_ACTIVE_USER_PROFILE, bytes([profile]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("User profile set to %s", profile)
-                    return True
-                else:
-                    _LOGGER.warning("No response received for user profile command")
-                    return False
-            else:
-                _LOGGER.error("Cannot set user profile: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to set user profile: %s", ex)
-            return False
+        # The protocol has no data point for the active user profile
+        _LOGGER.error("Setting the user profile is not supported by the device protocol")
+        return False
 
     async def toggle_seat_heating(self) -> bool:
         """Toggle seat heating."""
-        try:
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_SEAT_HEATING)
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Seat heating toggled")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for seat heating command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle seat heating: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle seat heating: %s", ex)
-            return False
+        # The protocol has no high-level seat heating command
+        _LOGGER.error("Toggling seat heating is not supported by the device protocol")
+        return False
 
     async def toggle_night_light(self) -> bool:
         """Toggle night light."""
-        try:
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_high_level_command(HighLevelCommand.TOGGLE_ORIENTATION_LIGHT)
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Night light toggled")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for night light command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle night light: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle night light: %s", ex)
-            return False
-
+        return await self._send_command(HighLevelCommand.TOGGLE_ORIENTATION_LIGHT, "toggle night light")
+    
     async def toggle_oscillating_spray(self) -> bool:
         """Toggle oscillating spray."""
-        try:
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_OSCILLATING, bytes([1]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Oscillating spray toggled")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for oscillating spray command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle oscillating spray: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle oscillating spray: %s", ex)
-            return False
+        # The protocol only exposes the stored oscillation setting, not a toggle
+        _LOGGER.error("Toggling oscillating spray is not supported by the device protocol")
+        return False
 
     async def toggle_auto_flush(self) -> bool:
         """Toggle auto flush."""
-        try:
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_AUTO_FLUSH, bytes([1]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Auto flush toggled")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for auto flush command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle auto flush: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle auto flush: %s", ex)
-            return False
+        # The protocol has no auto flush toggle data point
+        _LOGGER.error("Toggling auto flush is not supported by the device protocol")
+        return False
 
     async def toggle_barrier_free_mode(self) -> bool:
         """Toggle barrier-free mode."""
-        try:
-            if self._client and self._client.is_connected:
-                frame = GeberitProtocolSerializer.create_data_point_write(DataPoint.DP_BARRIER_FREE_MODE, bytes([1]))
-                frame_data = GeberitProtocolSerializer.encode_with_cobs(frame)
-                response_data = await self._send_frame_and_wait_response(frame_data)
-                
-                if response_data:
-                    _LOGGER.debug("Barrier-free mode toggled")
-                    return True
-                else:
-                    _LOGGER.warning("No response received for barrier-free mode command")
-                    return False
-            else:
-                _LOGGER.error("Cannot toggle barrier-free mode: device not connected")
-                return False
-        except Exception as ex:
-            _LOGGER.error("Failed to toggle barrier-free mode: %s", ex)
-            return False
+        # The protocol has no barrier-free mode data point
+        _LOGGER.error("Toggling barrier-free mode is not supported by the device protocol")
+        return False
 
     def _update_device_state_from_notification(self, status_params: SystemParameters):
         """Update device state from parsed notification data."""
@@ -14,11 +14,16 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
 from .entity import GeberitAquaCleanEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness conversion between the device (0-100%) and Home Assistant (0-255)
+_DEVICE_TO_HA_BRIGHTNESS = tuple(round(value * 255 / 100) for value in range(101))
+_HA_TO_DEVICE_BRIGHTNESS = tuple(round(value * 100 / 255) for value in range(256))
+
+_RGB_FIELDS = ("night_light_red", "night_light_green", "night_light_blue")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,23 +31,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Geberit AquaClean light entities from a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    coordinator = data["coordinator"]
+    coordinator = config_entry.runtime_data.coordinator
     
     entities = []
     
     # Add night light entity if feature is available
     if coordinator.client.has_feature("night_light"):
         entities.append(GeberitNightLight(coordinator))
-        _LOGGER.info("Added night light entity")
+        _LOGGER.debug("Added night light entity")
     
     # Add orientation light entity if feature is available (Sela only)
     if coordinator.client.has_feature("orientation_light"):
         entities.append(GeberitOrientationLight(coordinator))
-        _LOGGER.info("Added orientation light entity")
+        _LOGGER.debug("Added orientation light entity")
     
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities)
 
 
 class GeberitNightLight(GeberitAquaCleanEntity, LightEntity):
@@ -55,74 +59,93 @@ class GeberitNightLight(GeberitAquaCleanEntity, LightEntity):
 
     def __init__(self, coordinator) -> None:
         """Initialize the night light."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self.coordinator.base_unique_id}_night_light"
+        super().__init__(coordinator, "night_light")
+        self._update_cached_state()
+
+    @callback
+    def _update_cached_state(self) -> None:
+        """Cache the state read from the current coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._cached_available = False
+            self._cached_is_on = False
+            self._cached_brightness = None
+            self._cached_rgb = None
+            return
+        self._cached_available = getattr(data, "connected", False)
+        self._cached_is_on = getattr(data, 'night_light', False)
+        # Get brightness from device state (0-100) and convert to HA format (0-255)
+        device_brightness = getattr(data, 'night_light_brightness', 0)
+        self._cached_brightness = _DEVICE_TO_HA_BRIGHTNESS[device_brightness]
+        self._cached_rgb = (
+            getattr(data, 'night_light_red', 255),
+            getattr(data, 'night_light_green', 255),
+            getattr(data, 'night_light_blue', 255),
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._cached_available
 
     @property
     def is_on(self) -> bool:
         """Return true if the night light is on."""
-        if not self.coordinator.data:
-            return False
-        return getattr(self.coordinator.data, 'night_light', False)
+        return self._cached_is_on
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of the night light (0-255)."""
-        if not self.coordinator.data:
-            return None
-        # Get brightness from device state (0-100) and convert to HA format (0-255)
-        device_brightness = getattr(self.coordinator.data, 'night_light_brightness', 0)
-        return int((device_brightness / 100.0) * 255) if device_brightness else 0
+        return self._cached_brightness
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the RGB color value."""
-        if not self.coordinator.data:
-            return None
-        
-        red = getattr(self.coordinator.data, 'night_light_red', 255)
-        green = getattr(self.coordinator.data, 'night_light_green', 255) 
-        blue = getattr(self.coordinator.data, 'night_light_blue', 255)
-        
-        return (red, green, blue)
+        return self._cached_rgb
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the night light."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         rgb_color = kwargs.get(ATTR_RGB_COLOR)
         
+        # Turning on without a brightness sets 100%
+        device_brightness = 100 if brightness is None else _HA_TO_DEVICE_BRIGHTNESS[brightness]
         try:
-            # Turn on the night light
-            await self.coordinator.client.set_night_light_state(True)
-            
-            # Set brightness if provided (convert from 0-255 to 0-100)
-            if brightness is not None:
-                device_brightness = int((brightness / 255.0) * 100)
-                await self.coordinator.client.set_night_light_brightness(device_brightness)
-            
-            # Set RGB color if provided
+            # Turn on with the requested brightness (converted from 0-255 to 0-100)
+            # and color in a single client call
+            if not await self.coordinator.client.set_night_light(
+                state=True,
+                brightness=device_brightness,
+                rgb=rgb_color,
+            ):
+                return
+
+            # Publish the written values now; the next poll reconciles them
+            changes = {
+                "night_light": device_brightness > 0,
+                "night_light_brightness": device_brightness,
+            }
             if rgb_color is not None:
-                red, green, blue = rgb_color
-                await self.coordinator.client.set_night_light_color(red, green, blue)
-                
-            # Request coordinator update
-            await self.coordinator.async_request_refresh()
-            
+                changes.update(zip(_RGB_FIELDS, rgb_color))
+            self.coordinator.async_apply_optimistic_state(**changes)
+
         except Exception as e:
             _LOGGER.error("Failed to turn on night light: %s", e)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the night light."""
         try:
-            await self.coordinator.client.set_night_light_state(False)
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.client.set_night_light(state=False):
+                self.coordinator.async_apply_optimistic_state(
+                    night_light=False, night_light_brightness=0
+                )
         except Exception as e:
             _LOGGER.error("Failed to turn off night light: %s", e)
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+    def _state_signature(self) -> tuple:
+        """Return the values that make up the published state."""
+        return (self._cached_available, self._cached_is_on, self._cached_brightness, self._cached_rgb)
 
 
 class GeberitOrientationLight(GeberitAquaCleanEntity, LightEntity):
@@ -135,53 +158,70 @@ class GeberitOrientationLight(GeberitAquaCleanEntity, LightEntity):
 
     def __init__(self, coordinator) -> None:
         """Initialize the orientation light."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self.coordinator.base_unique_id}_orientation_light"
+        super().__init__(coordinator, "orientation_light")
+        self._update_cached_state()
+
+    @callback
+    def _update_cached_state(self) -> None:
+        """Cache the state read from the current coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._cached_available = False
+            self._cached_is_on = False
+            self._cached_brightness = None
+            return
+        self._cached_available = getattr(data, "connected", False)
+        self._cached_is_on = getattr(data, 'orientation_light', False)
+        # Get brightness from device state (0-100) and convert to HA format (0-255)
+        device_brightness = getattr(data, 'orientation_light_brightness', 0)
+        self._cached_brightness = _DEVICE_TO_HA_BRIGHTNESS[device_brightness]
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._cached_available
 
     @property
     def is_on(self) -> bool:
         """Return true if the orientation light is on."""
-        if not self.coordinator.data:
-            return False
-        return getattr(self.coordinator.data, 'orientation_light', False)
+        return self._cached_is_on
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of the orientation light (0-255)."""
-        if not self.coordinator.data:
-            return None
-        # Get brightness from device state (0-100) and convert to HA format (0-255)
-        device_brightness = getattr(self.coordinator.data, 'orientation_light_brightness', 0)
-        return int((device_brightness / 100.0) * 255) if device_brightness else 0
+        return self._cached_brightness
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the orientation light."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         
+        # On/off is itself a brightness write, so a requested brightness
+        # (converted from 0-255 to 0-100) turns the light on in one write
+        device_brightness = 100 if brightness is None else _HA_TO_DEVICE_BRIGHTNESS[brightness]
         try:
-            # Turn on the orientation light
-            await self.coordinator.client.set_orientation_light_state(True)
-            
-            # Set brightness if provided (convert from 0-255 to 0-100)
-            if brightness is not None:
-                device_brightness = int((brightness / 255.0) * 100)
-                await self.coordinator.client.set_orientation_light_brightness(device_brightness)
-                
-            # Request coordinator update
-            await self.coordinator.async_request_refresh()
-            
+            if not await self.coordinator.client.set_orientation_light_brightness(device_brightness):
+                return
+
+            # Publish the written values now; the next poll reconciles them
+            self.coordinator.async_apply_optimistic_state(
+                orientation_light=device_brightness > 0,
+                orientation_light_brightness=device_brightness,
+            )
+
         except Exception as e:
             _LOGGER.error("Failed to turn on orientation light: %s", e)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the orientation light."""
         try:
-            await self.coordinator.client.set_orientation_light_state(False)
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.client.set_orientation_light_state(False):
+                self.coordinator.async_apply_optimistic_state(
+                    orientation_light=False, orientation_light_brightness=0
+                )
         except Exception as e:
             _LOGGER.error("Failed to turn off orientation light: %s", e)
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+    def _state_signature(self) -> tuple:
+        """Return the values that make up the published state."""
+        return (self._cached_available, self._cached_is_on, self._cached_brightness)
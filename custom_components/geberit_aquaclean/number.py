@@ -9,7 +9,6 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
 from .entity import GeberitAquaCleanEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,6 +49,14 @@ NUMBERS: tuple[NumberEntityDescription, ...] = (
     ),
 )
 
+# Client setter for each number entity key
+_SETTERS: dict[str, str] = {
+    "water_temperature": "set_water_temperature",
+    "spray_intensity": "set_spray_intensity",
+    "spray_position": "set_spray_position",
+    "active_user_profile": "set_user_profile",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,8 +64,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Geberit AquaClean number entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    coordinator = entry.runtime_data.coordinator
+    client = entry.runtime_data.client
 
     entities = [
         GeberitAquaCleanNumberEntity(coordinator, client, description) 
@@ -80,6 +87,8 @@ class GeberitAquaCleanNumberEntity(GeberitAquaCleanEntity, NumberEntity):
         """Initialize the number entity."""
         super().__init__(coordinator, description.key)
         self._client = client
+        # Each entity drives one fixed setting, so resolve its setter once
+        self._setter = getattr(client, _SETTERS[description.key])
         self.entity_description = description
         self._attr_name = f"{description.name}"
 
@@ -95,18 +104,11 @@ class GeberitAquaCleanNumberEntity(GeberitAquaCleanEntity, NumberEntity):
         try:
             # Convert to int for our parameters
             int_value = int(value)
-            
-            if self.entity_description.key == "water_temperature":
-                await self._client.set_water_temperature(int_value)
-            elif self.entity_description.key == "spray_intensity":
-                await self._client.set_spray_intensity(int_value)
-            elif self.entity_description.key == "spray_position":
-                await self._client.set_spray_position(int_value)
-            elif self.entity_description.key == "active_user_profile":
-                await self._client.set_user_profile(int_value)
-                
-            # Trigger a coordinator refresh to update the state
-            await self.coordinator.async_request_refresh()
-            
+            if await self._setter(int_value):
+                # Publish the written value now; the next poll reconciles it
+                self.coordinator.async_apply_optimistic_state(
+                    **{self.entity_description.key: int_value}
+                )
+
         except Exception as ex:
             _LOGGER.error("Failed to set %s to %s: %s", self.entity_description.key, value, ex)
@@ -1,9 +1,9 @@
 """Geberit AquaClean BLE protocol handling for Geberit AquaClean communication."""
 import struct
 import logging
-import binascii
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Deque, Optional
 from enum import Enum, IntEnum
 
 _LOGGER = logging.getLogger(__name__)
@@ -14,6 +14,13 @@ FRAME_END_BYTE = 0x03
 MAX_FRAME_SIZE = 20  # BLE characteristic max size
 RESPONSE_TIMEOUT = 5.0  # seconds
 
+# Precompiled payload layouts for request frames
+_U16 = struct.Struct('<H')  # Command ID
+_DP_HEADER = struct.Struct('<HB')  # DP ID + read/write flag
+_U8 = struct.Struct('<B')  # Frame header byte
+_U8_PAIR = struct.Struct('<BB')  # Consecutive frame header + count
+_STATUS_BYTES = struct.Struct('<6B')  # Leading system status values
+
 class CommandType(Enum):
     """BLE command types."""
     LID_CONTROL = 0x01
@@ -129,6 +136,7 @@ class DataPoint(Enum):
     
     # General spray and temperature controls (for backward compatibility)
     DP_SPRAY_INTENSITY = 570  # Maps to DP_SET_ACTIVE_ANAL_SPRAY_INTENSITY
+    DP_SPRAY_POSITION = 572  # Maps to DP_SET_ACTIVE_ANAL_SPRAY_ARM_POSITION
     DP_WATER_TEMPERATURE = 574  # Maps to DP_SET_ACTIVE_SHOWER_WATER_TEMPERATURE
     DP_START_STOP_DRYING = 874
     DP_DRYING_STATUS = 875
@@ -208,7 +216,7 @@ class DataType(Enum):
     TIMESTAMP_UTC = "TimeStampUtc"  # UTC timestamp (Unix timestamp)
     SIGNED = "Signed"          # Signed integer (-2147483648 to +2147483647)
 
-@dataclass
+@dataclass(slots=True)
 class BLEFrame:
     """Represents a proper BLE frame with verified structure."""
     frame_id: int           # Frame type (0, 2, or 3)
@@ -224,9 +232,9 @@ class BLEFrame:
         
         # For consecutive frames, add count byte
         if self.frame_id == BLEFrameType.CONSECUTIVE_FRAME.value:
-            return bytes([header, len(self.payload)]) + self.payload
+            return _U8_PAIR.pack(header, len(self.payload)) + self.payload
         else:
-            return bytes([header]) + self.payload
+            return _U8.pack(header) + self.payload
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'BLEFrame':
@@ -234,13 +242,8 @@ class BLEFrame:
         if len(data) < 1:
             raise ValueError("Invalid frame data")
             
-        header = data[0]
-        
         # Parse header bits
-        frame_id = (header >> 5) & 0x07
-        has_msg_type = bool((header >> 4) & 0x01)
-        transaction = (header >> 1) & 0x07
-        flag = header & 0x01
+        frame_id, has_msg_type, transaction, flag = FRAME_HEADER_TABLE[data[0]]
         
         # Extract payload based on frame type
         if frame_id == BLEFrameType.CONSECUTIVE_FRAME.value and len(data) > 1:
@@ -257,36 +260,26 @@ class BLEFrame:
             payload=payload
         )
 
+# Header byte -> (frame ID, message type present, transaction, flag)
+FRAME_HEADER_TABLE: tuple[tuple[int, bool, int, int], ...] = tuple(
+    ((header >> 5) & 0x07, bool((header >> 4) & 0x01), (header >> 1) & 0x07, header & 0x01)
+    for header in range(256)
+)
+
 class COBSEncoder:
     """COBS (Consistent Overhead Byte Stuffing) encoder/decoder."""
     
     @staticmethod
     def encode(data: bytes) -> bytes:
         """Encode data using COBS framing."""
-        if not data:
-            return b'\x01\x00'
-        
         output = bytearray()
-        code = 1
-        code_index = 0
-        output.append(0)  # Placeholder for code
-        
-        for byte in data:
-            if byte == 0:
-                output[code_index] = code
-                code_index = len(output)
-                output.append(0)
-                code = 1
-            else:
-                output.append(byte)
-                code += 1
-                if code == 255:
-                    output[code_index] = code
-                    code_index = len(output)
-                    output.append(0)
-                    code = 1
-        
-        output[code_index] = code
+        # Each zero-delimited run is emitted in blocks of at most 254 bytes; a
+        # run that fills its last block exactly is followed by an empty block
+        for run in bytes(data).split(b'\x00'):
+            for start in range(0, len(run) + 1, 254):
+                block = run[start:start + 254]
+                output.append(len(block) + 1)
+                output += block
         output.append(0)  # Frame delimiter
         return bytes(output)
     
@@ -297,31 +290,28 @@ class COBSEncoder:
             raise ValueError("Invalid COBS frame")
         
         data = data[:-1]  # Remove delimiter
-        if not data:
-            return b''
-            
+        length = len(data)
         output = bytearray()
         i = 0
         
-        while i < len(data):
+        while i < length:
             code = data[i]
             i += 1
             
             if code == 0:
                 break
                 
-            # Copy non-zero bytes
-            for j in range(min(code - 1, len(data) - i)):
-                output.append(data[i + j])
+            # Copy the non-zero bytes of this block in one slice
+            output += data[i:i + code - 1]
             i += code - 1
             
             # Add zero byte if needed
-            if code < 255 and i < len(data):
+            if code < 255 and i < length:
                 output.append(0)
         
         return bytes(output)
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolFrame:
     """Represents a single protocol frame."""
     frame_type: int
@@ -355,7 +345,7 @@ class ProtocolFrame:
         frame_data = data[4:4+length]
         return cls(frame_type, sequence_number, frame_data)
 
-@dataclass
+@dataclass(slots=True)
 class DeviceIdentification:
     """Device identification information."""
     sap_number: str = ""
@@ -365,7 +355,7 @@ class DeviceIdentification:
     firmware_version: str = ""
     initial_operation_date: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class SystemParameters:
     """System parameters from device."""
     # Basic status
@@ -398,8 +388,8 @@ class BLEFrameCollector:
     
     def __init__(self):
         """Initialize frame collector."""
-        self._pending_frames: Dict[int, List[BLEFrame]] = {}
-        self._complete_messages: List[bytes] = []
+        self._pending_payload = bytearray()
+        self._complete_messages: Deque[bytes] = deque()
         
     def add_frame(self, frame: BLEFrame) -> bool:
         """Add a frame to the collector.
@@ -414,33 +404,25 @@ class BLEFrameCollector:
             self._complete_messages.append(frame.payload)
             return True
             
-        # For multi-frame messages, collect and assemble
-        if frame_id not in self._pending_frames:
-            self._pending_frames[frame_id] = []
-            
-        self._pending_frames[frame_id].append(frame)
-        
-        # Check if we have a complete message
-        if frame_id == BLEFrameType.CONSECUTIVE_FRAME.value:
-            return self._try_assemble_message(frame_id)
+        # Flow control frames only acknowledge transfers and carry no message data
+        if frame_id != BLEFrameType.CONSECUTIVE_FRAME.value:
+            _LOGGER.debug("Ignoring frame with ID %d", frame_id)
+            return False
             
-        return False
+        # For multi-frame messages, collect payloads in a single buffer
+        self._pending_payload += frame.payload
+        return self._try_assemble_message()
         
-    def _try_assemble_message(self, frame_id: int) -> bool:
+    def _try_assemble_message(self) -> bool:
         """Try to assemble a complete message from frames."""
-        if frame_id not in self._pending_frames:
+        if not self._pending_payload:
             return False
             
-        frames = self._pending_frames[frame_id]
-        frames.sort(key=lambda f: f.transaction)
-        
-        # For now, just concatenate all payloads
+        # For now, every consecutive frame completes the message
         # TODO: Implement proper multi-frame assembly when needed
-        message_data = b''.join(frame.payload for frame in frames)
+        message_data = bytes(self._pending_payload)
         self._complete_messages.append(message_data)
-        
-        # Clear pending frames for this type
-        del self._pending_frames[frame_id]
+        self._pending_payload.clear()
         
         _LOGGER.debug("Assembled complete message of %d bytes", len(message_data))
         return True
@@ -448,7 +430,7 @@ class BLEFrameCollector:
     def get_complete_message(self) -> Optional[bytes]:
         """Get the next complete message if available."""
         if self._complete_messages:
-            return self._complete_messages.pop(0)
+            return self._complete_messages.popleft()
         return None
 
 
@@ -459,7 +441,7 @@ class GeberitProtocolSerializer:
     def create_high_level_command(command: HighLevelCommand) -> BLEFrame:
         """Create a high-level command frame."""
         # High-level commands use single frame format with message type
-        payload = struct.pack('<H', command.value)  # Command ID as 2-byte value
+        payload = _U16.pack(command.value)  # Command ID as 2-byte value
         
         return BLEFrame(
             frame_id=BLEFrameType.SINGLE_START_FRAME.value,
@@ -473,7 +455,7 @@ class GeberitProtocolSerializer:
     def create_data_point_read(data_point: DataPoint) -> BLEFrame:
         """Create a data point read request."""
         # Data point read request
-        payload = struct.pack('<HB', data_point.value, 0x00)  # DP ID + read flag
+        payload = _DP_HEADER.pack(data_point.value, 0x00)  # DP ID + read flag
         
         return BLEFrame(
             frame_id=BLEFrameType.SINGLE_START_FRAME.value,
@@ -487,7 +469,7 @@ class GeberitProtocolSerializer:
     def create_read_data_point_request(data_point_id: int) -> BLEFrame:
         """Create a data point read request by ID for feature discovery."""
         # Data point read request using direct ID
-        payload = struct.pack('<HB', data_point_id, 0x00)  # DP ID + read flag
+        payload = _DP_HEADER.pack(data_point_id, 0x00)  # DP ID + read flag
         
         return BLEFrame(
             frame_id=BLEFrameType.SINGLE_START_FRAME.value,
@@ -497,11 +479,25 @@ class GeberitProtocolSerializer:
             payload=payload
         )
     
+    @staticmethod
+    def create_write_data_point_request(data_point_id: int, value: bytes) -> BLEFrame:
+        """Create a data point write request by ID for data points without an enum member."""
+        # Data point write request using direct ID
+        payload = _DP_HEADER.pack(data_point_id, 0x01) + value  # DP ID + write flag + value
+        
+        return BLEFrame(
+            frame_id=BLEFrameType.SINGLE_START_FRAME.value,
+            has_msg_type=True,
+            transaction=2,
+            flag=0,
+            payload=payload
+        )
+    
     @staticmethod
     def create_data_point_write(data_point: DataPoint, value: bytes) -> BLEFrame:
         """Create a data point write request."""
         # Data point write request
-        payload = struct.pack('<HB', data_point.value, 0x01) + value  # DP ID + write flag + value
+        payload = _DP_HEADER.pack(data_point.value, 0x01) + value  # DP ID + write flag + value
         
         return BLEFrame(
             frame_id=BLEFrameType.SINGLE_START_FRAME.value,
@@ -572,8 +568,8 @@ class GeberitProtocolSerializer:
             
             # Extract fields from response (simplified parsing)
             if len(data) >= 4:
-                device_info.sap_number = f"SAP-{struct.unpack('<H', data[0:2])[0]}"
-                device_info.serial_number = f"SN-{struct.unpack('<H', data[2:4])[0]:08d}"
+                device_info.sap_number = f"SAP-{_U16.unpack_from(data, 0)[0]}"
+                device_info.serial_number = f"SN-{_U16.unpack_from(data, 2)[0]:08d}"
                 
             if len(data) >= 8:
                 device_info.firmware_version = f"FW-{data[4]}.{data[5]}.{data[6]}.{data[7]}"
@@ -600,7 +596,7 @@ class GeberitProtocolSerializer:
             
             if data and len(data) >= 6:
                 # Parse status values from response
-                status_bytes = struct.unpack('<6B', data[:6])
+                status_bytes = _STATUS_BYTES.unpack_from(data)
                 
                 # Map to system parameters based on expected data point order
                 params.anal_shower_running = status_bytes[0] > 0
@@ -637,8 +633,8 @@ class GeberitProtocolSerializer:
             if not data or len(data) < 16:
                 return params
                 
-            hex_data = binascii.hexlify(data).decode('ascii')
-            _LOGGER.debug("Parsing notification: %s", hex_data)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Parsing notification: %s", data.hex())
             
             # Parse the notification structure based on observed data
             # 30140c030003000000003130001200cf08
@@ -646,8 +642,8 @@ class GeberitProtocolSerializer:
             # Extract key status fields
             if len(data) >= 8:
                 # Status flags are at positions 4-7: 00030000
-                status_word1 = struct.unpack('<H', data[4:6])[0]  # 0x0300 = 768
-                status_word2 = struct.unpack('<H', data[6:8])[0]  # 0x0000 = 0
+                status_word1 = _U16.unpack_from(data, 4)[0]  # 0x0300 = 768
+                status_word2 = _U16.unpack_from(data, 6)[0]  # 0x0000 = 0
                 
                 # The value 0x0003 (3) in little endian suggests some basic state flags
                 # For now, we'll assume all functions are idle based on the zero values
@@ -655,20 +651,19 @@ class GeberitProtocolSerializer:
                 params.anal_shower_running = False
                 params.lady_shower_running = False
                 params.dryer_running = False
-                params.lid_open = False  # Assume closed
+                params.lid_position = False  # Assume closed
                 
                 _LOGGER.debug("Parsed status - Status1: 0x%04x, Status2: 0x%04x", 
                              status_word1, status_word2)
             
             # Extract device identifier if available
             if len(data) >= 12:
-                device_id_bytes = data[8:10]  # 31 30
-                device_id = struct.unpack('<H', device_id_bytes)[0]  # 0x3031
+                device_id = _U16.unpack_from(data, 8)[0]  # 31 30 -> 0x3031
                 _LOGGER.debug("Device ID from notification: 0x%04x", device_id)
                 
             # Extract error/maintenance flags if available  
             if len(data) >= 14:
-                maint_flags = struct.unpack('<H', data[10:12])[0]  # 00 12
+                maint_flags = _U16.unpack_from(data, 10)[0]  # 00 12
                 params.descaling_needed = bool(maint_flags & 0x01)
                 params.filter_replacement_needed = bool(maint_flags & 0x02)
                 _LOGGER.debug("Maintenance flags: 0x%04x", maint_flags)
@@ -691,20 +686,13 @@ class GeberitProtocolSerializer:
             device_id = DeviceIdentification()
             
             # Extract strings from the data (assuming null-terminated strings)
-            strings = []
-            current_string = b''
-            
-            for byte in data:
-                if byte == 0:  # Null terminator
-                    if current_string:
-                        strings.append(current_string.decode('utf-8', errors='ignore'))
-                        current_string = b''
-                else:
-                    current_string += bytes([byte])
-                    
-            # Add final string if no null terminator
-            if current_string:
-                strings.append(current_string.decode('utf-8', errors='ignore'))
+            # Split once instead of growing a bytes object per byte; a final
+            # string without a null terminator is kept as well
+            strings = [
+                chunk.decode('utf-8', errors='ignore')
+                for chunk in bytes(data).split(b'\x00')
+                if chunk
+            ]
                 
             # Map strings to fields (order based on typical device info)
             if len(strings) >= 1:
@@ -9,7 +9,6 @@ from homeassistant.const import UnitOfPower, UnitOfPressure
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
 from .entity import GeberitAquaCleanEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,8 +20,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Geberit AquaClean sensor entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    coordinator = entry.runtime_data.coordinator
+    client = entry.runtime_data.client
     
     # Define sensor configurations with their feature requirements
     sensor_configs = [
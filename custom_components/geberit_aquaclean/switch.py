@@ -8,9 +8,8 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .entity import GeberitAquaCleanEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,8 +20,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the switch platform."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][config_entry.entry_id]["client"]
+    coordinator = config_entry.runtime_data.coordinator
+    client = config_entry.runtime_data.client
     
     # Define switch configurations with their feature requirements
     switch_configs = [
@@ -53,15 +52,14 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GeberitLidSwitch(CoordinatorEntity, SwitchEntity):
+class GeberitLidSwitch(GeberitAquaCleanEntity, SwitchEntity):
     """Representation of a Geberit AquaClean lid switch."""
 
     def __init__(self, coordinator, client):
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "lid")
         self._client = client
         self._attr_name = "Lid"
-        self._attr_unique_id = f"geberit_aquaclean_lid_{coordinator.client.mac_address.replace(':', '')}"
         self._attr_icon = "mdi:toilet"
 
     @property
@@ -69,24 +67,16 @@ class GeberitLidSwitch(CoordinatorEntity, SwitchEntity):
         """Return true if the switch is on."""
         if self.coordinator.data is None:
             return None
-        return getattr(self.coordinator.data, "lid_open", False)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.data is not None 
-            and getattr(self.coordinator.data, "connected", False)
-        )
+        return getattr(self.coordinator.data, "lid_position", False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the lid switch on (open lid)."""
-        if self.coordinator.data and not getattr(self.coordinator.data, "lid_open", False):
+        if self.coordinator.data and not getattr(self.coordinator.data, "lid_position", False):
             await self._toggle_lid()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the lid switch off (close lid)."""
-        if self.coordinator.data and getattr(self.coordinator.data, "lid_open", False):
+        if self.coordinator.data and getattr(self.coordinator.data, "lid_position", False):
             await self._toggle_lid()
 
     async def _toggle_lid(self) -> None:
@@ -101,30 +91,15 @@ class GeberitLidSwitch(CoordinatorEntity, SwitchEntity):
         except Exception as e:
             _LOGGER.error("Error toggling lid position: %s", e)
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
-
 
-class GeberitRearWashSwitch(CoordinatorEntity, SwitchEntity):
+class GeberitRearWashSwitch(GeberitAquaCleanEntity, SwitchEntity):
     """Representation of a Geberit AquaClean rear wash switch."""
 
     def __init__(self, coordinator, client):
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "rear_wash")
         self._client = client
         self._attr_name = "Rear Wash"
-        self._attr_unique_id = f"geberit_aquaclean_rear_wash_{coordinator.client.mac_address.replace(':', '')}"
         self._attr_icon = "mdi:shower"
 
     @property
@@ -134,14 +109,6 @@ class GeberitRearWashSwitch(CoordinatorEntity, SwitchEntity):
             return None
         return getattr(self.coordinator.data, "anal_shower_running", False)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.data is not None 
-            and getattr(self.coordinator.data, "connected", False)
-        )
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start rear wash."""
         try:
@@ -164,30 +131,15 @@ class GeberitRearWashSwitch(CoordinatorEntity, SwitchEntity):
         except Exception as e:
             _LOGGER.error("Error stopping rear wash: %s", e)
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
-
 
-class GeberitFrontWashSwitch(CoordinatorEntity, SwitchEntity):
+class GeberitFrontWashSwitch(GeberitAquaCleanEntity, SwitchEntity):
     """Representation of a Geberit AquaClean front wash switch."""
 
     def __init__(self, coordinator, client):
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "front_wash")
         self._client = client
         self._attr_name = "Front Wash"
-        self._attr_unique_id = f"geberit_aquaclean_front_wash_{coordinator.client.mac_address.replace(':', '')}"
         self._attr_icon = "mdi:shower-head"
 
     @property
@@ -197,14 +149,6 @@ class GeberitFrontWashSwitch(CoordinatorEntity, SwitchEntity):
             return None
         return getattr(self.coordinator.data, "lady_shower_running", False)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.data is not None 
-            and getattr(self.coordinator.data, "connected", False)
-        )
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start front wash."""
         try:
@@ -227,30 +171,15 @@ class GeberitFrontWashSwitch(CoordinatorEntity, SwitchEntity):
         except Exception as e:
             _LOGGER.error("Error stopping front wash: %s", e)
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
-
 
-class GeberitDryerSwitch(CoordinatorEntity, SwitchEntity):
+class GeberitDryerSwitch(GeberitAquaCleanEntity, SwitchEntity):
     """Representation of a Geberit AquaClean dryer switch."""
 
     def __init__(self, coordinator, client):
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, "dryer")
         self._client = client
         self._attr_name = "Air Dry"
-        self._attr_unique_id = f"geberit_aquaclean_dryer_{coordinator.client.mac_address.replace(':', '')}"
         self._attr_icon = "mdi:air-purifier"
 
     @property
@@ -260,14 +189,6 @@ class GeberitDryerSwitch(CoordinatorEntity, SwitchEntity):
             return None
         return getattr(self.coordinator.data, "dryer_running", False)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            self.coordinator.data is not None 
-            and getattr(self.coordinator.data, "connected", False)
-        )
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start dryer."""
         try:
@@ -289,17 +210,3 @@ class GeberitDryerSwitch(CoordinatorEntity, SwitchEntity):
                 _LOGGER.error("Failed to stop dryer")
         except Exception as e:
             _LOGGER.error("Error stopping dryer: %s", e)
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        device_data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.client.mac_address)},
-            "name": getattr(device_data, "description", "Geberit AquaClean") if device_data else "Geberit AquaClean",
-            "manufacturer": "Geberit",
-            "model": "AquaClean",
-            "sw_version": getattr(device_data, "firmware_version", "Unknown") if device_data else "Unknown",
-            "serial_number": getattr(device_data, "serial_number", None) if device_data else None,
-            "hw_version": getattr(device_data, "sap_number", None) if device_data else None,
-        }
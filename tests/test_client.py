@@ -0,0 +1,196 @@
+"""Tests for the Geberit AquaClean BLE client."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from bleak.exc import BleakError
+
+from custom_components.geberit_aquaclean.binary_sensor import BINARY_SENSORS
+from custom_components.geberit_aquaclean.geberit_client import (
+    GeberitAquaCleanClient,
+    _normalize_features,
+)
+
+MAC_ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def _connected_client(hass) -> GeberitAquaCleanClient:
+    """Return a client whose BLE link reports as connected."""
+    client = GeberitAquaCleanClient(MAC_ADDRESS, hass)
+    client._client = MagicMock(is_connected=True)
+    return client
+
+
+async def test_concurrent_state_reads_share_one_ble_exchange(hass):
+    """Test that callers arriving during a read wait for it instead of sending again."""
+    client = _connected_client(hass)
+    release = asyncio.Event()
+
+    async def _exchange(*args, **kwargs) -> bytes:
+        await release.wait()
+        return b""
+
+    client._send_frame_and_wait_response = AsyncMock(side_effect=_exchange)
+
+    callers = [asyncio.create_task(client.get_device_state()) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    states = await asyncio.gather(*callers)
+
+    assert client._send_frame_and_wait_response.await_count == 1
+    assert all(state is states[0] for state in states)
+
+
+async def test_failed_state_read_is_cleared_after_waiters_cancel(hass):
+    """Test that a read failing after its only waiter was cancelled is cleaned up."""
+    client = _connected_client(hass)
+    started = asyncio.Event()
+    fail = asyncio.Event()
+
+    async def _read() -> None:
+        started.set()
+        await fail.wait()
+        raise BleakError("link lost")
+
+    client._async_read_device_state = _read
+
+    caller = asyncio.create_task(client.get_device_state())
+    await started.wait()
+    read = client._state_read
+    caller.cancel()
+    fail.set()
+    await asyncio.wait([read, caller])
+
+    assert caller.cancelled()
+    assert client._state_read is None
+
+
+async def test_repeated_setting_is_written_once(hass):
+    """Test that re-sending the value the device state holds skips the write."""
+    client = _connected_client(hass)
+    client._send_frame_and_wait_response = AsyncMock(return_value=b"\x01")
+
+    assert await client.set_water_temperature(38)
+    assert await client.set_water_temperature(38)
+
+    assert client._send_frame_and_wait_response.await_count == 1
+    assert client._device_state.water_temperature == 38
+
+
+async def test_setting_is_rewritten_once_device_state_differs(hass):
+    """Test that a changed device state or a failed write lets the value through."""
+    client = _connected_client(hass)
+    client._send_frame_and_wait_response = AsyncMock(return_value=b"\x01")
+
+    assert await client.set_spray_intensity(4)
+    client._device_state.spray_intensity = 2
+    assert await client.set_spray_intensity(4)
+    assert client._send_frame_and_wait_response.await_count == 2
+
+    client._send_frame_and_wait_response.return_value = b""
+    assert not await client.set_spray_position(5)
+    client._send_frame_and_wait_response.return_value = b"\x01"
+    assert await client.set_spray_position(5)
+    assert client._send_frame_and_wait_response.await_count == 4
+
+
+async def test_toggle_commands_are_never_skipped(hass):
+    """Test that on-off-on toggles in quick succession all reach the device."""
+    client = _connected_client(hass)
+    client._send_frame_and_wait_response = AsyncMock(return_value=b"\x01")
+
+    for _ in range(3):
+        assert await client.toggle_dryer()
+
+    assert client._send_frame_and_wait_response.await_count == 3
+
+
+async def test_detected_features_use_entity_feature_names(hass):
+    """Test that model detection persists the names the entity platforms check."""
+    client = _connected_client(hass)
+
+    async def _read_identification() -> None:
+        client._device_identification = MagicMock(sap_number="146.21x.xx.1")
+
+    client._read_device_identification = _read_identification
+    client._feature_store.async_save = AsyncMock()
+
+    await client._initialize_device()
+
+    assert client.has_feature("rear_wash")
+    assert client.has_feature("lady_wash")
+    assert not client.has_feature("anal_shower")
+    saved = client._feature_store.async_save.await_args.args[0]["features"]
+    assert {"rear_wash", "lady_wash"} <= set(saved)
+
+
+async def test_restored_features_map_old_names(hass):
+    """Test that a store written with the protocol names still enables the washes."""
+    client = GeberitAquaCleanClient(MAC_ADDRESS, hass)
+    client._feature_store.async_load = AsyncMock(
+        return_value={"sap_number": "146.21x.xx.1", "features": ["anal_shower", "lady_shower", "dryer"]}
+    )
+
+    await client.async_load_features()
+
+    assert client.has_feature("rear_wash")
+    assert client.has_feature("lady_wash")
+    assert client.has_feature("dryer")
+
+
+def test_normalized_sela_features_cover_platform_feature_keys(hass):
+    """Test that every feature key the platforms check is enabled for a Sela."""
+    client = GeberitAquaCleanClient(MAC_ADDRESS, hass)
+    features = _normalize_features(client._determine_features_from_sap_number("146.016"))
+
+    platform_keys = {feature for _, keys in BINARY_SENSORS for feature in keys}
+    # Switch and light platforms
+    platform_keys |= {"lid_control", "rear_wash", "lady_wash", "dryer"}
+    platform_keys |= {"night_light", "orientation_light"}
+    # Sensor platform
+    platform_keys.add("user_profiles")
+
+    assert platform_keys <= features.keys()
+
+
+async def test_changed_features_notify_after_identification(hass):
+    """Test that only an identified feature set differing from the restored one notifies."""
+    client = _connected_client(hass)
+    client._feature_store.async_save = AsyncMock()
+    features_changed = MagicMock()
+    client.async_on_features_changed(features_changed)
+
+    async def _read_identification() -> None:
+        client._device_identification = MagicMock(sap_number="146.21x.xx.1")
+
+    client._read_device_identification = _read_identification
+
+    # First install: nothing restored
+    await client._initialize_device()
+    assert features_changed.call_count == 1
+
+    # Restart with the saved features restored
+    restored = client.get_available_features()
+    client = _connected_client(hass)
+    client._feature_store.async_save = AsyncMock()
+    client._feature_store.async_load = AsyncMock(
+        return_value={"sap_number": "146.21x.xx.1", "features": restored}
+    )
+    client.async_on_features_changed(features_changed)
+    client._read_device_identification = _read_identification
+    await client.async_load_features()
+    await client._initialize_device()
+    assert features_changed.call_count == 1
+
+
+async def test_disconnect_tolerates_a_dropped_link(hass):
+    """Test that a BleakError while disconnecting is swallowed and the client dropped."""
+    client = _connected_client(hass)
+    ble_client = client._client
+    ble_client.stop_notify = AsyncMock()
+    ble_client.disconnect = AsyncMock(side_effect=BleakError("not connected"))
+
+    await client.disconnect()
+
+    ble_client.disconnect.assert_awaited_once()
+    assert client._client is None
+    assert not client.connected
@@ -0,0 +1,108 @@
+"""Tests for the Geberit AquaClean Bluetooth coordinator."""
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.geberit_aquaclean.coordinator import (
+    GeberitActiveBluetoothCoordinator,
+)
+from custom_components.geberit_aquaclean.geberit_client import (
+    DeviceState,
+    GeberitAquaCleanClient,
+)
+
+MAC_ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def _coordinator(hass, state: DeviceState) -> GeberitActiveBluetoothCoordinator:
+    """Return a coordinator whose client always reports the given state object."""
+    client = MagicMock(mac_address=MAC_ADDRESS)
+    client.get_device_state = AsyncMock(return_value=state)
+    coordinator = GeberitActiveBluetoothCoordinator(
+        hass, client, MagicMock(address=MAC_ADDRESS), "Geberit AquaClean", MAC_ADDRESS
+    )
+    coordinator._last_service_info = MagicMock()
+    return coordinator
+
+
+async def test_unchanged_poll_skips_listener_update(hass):
+    """Test that only polls that change a published field notify listeners."""
+    state = DeviceState(connected=True)
+    coordinator = _coordinator(hass, state)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator._async_poll()
+    assert listener.call_count == 1
+
+    await coordinator._async_poll()
+    assert listener.call_count == 1
+
+    state.user_is_sitting = True
+    await coordinator._async_poll()
+    assert listener.call_count == 2
+
+
+async def test_pushed_status_alone_does_not_publish(hass):
+    """Test that the raw pushed status is not compared as a published field."""
+    state = DeviceState(connected=True)
+    coordinator = _coordinator(hass, state)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator._async_poll()
+    state.system_params = MagicMock()
+    await coordinator._async_poll()
+
+    assert listener.call_count == 1
+
+
+async def test_poll_keeps_optimistically_written_values(hass):
+    """Test that a status read does not reset values the response does not carry."""
+    client = GeberitAquaCleanClient(MAC_ADDRESS, hass)
+    client._client = MagicMock(is_connected=True)
+    client._send_frame_and_wait_response = AsyncMock(return_value=bytes(6))
+    coordinator = GeberitActiveBluetoothCoordinator(
+        hass, client, MagicMock(address=MAC_ADDRESS), "Geberit AquaClean", MAC_ADDRESS
+    )
+    coordinator._last_service_info = MagicMock()
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+    await coordinator._async_poll()
+
+    coordinator.async_apply_optimistic_state(
+        water_temperature=39,
+        spray_intensity=5,
+        night_light=True,
+        night_light_brightness=80,
+        active_user_profile=2,
+    )
+    assert listener.call_count == 2
+
+    # Skip the shared-read cache so the poll really reads the device again
+    client._state_cache_ts = 0.0
+    await coordinator._async_poll()
+
+    assert client._send_frame_and_wait_response.await_count == 2
+    state = coordinator.data
+    assert state.water_temperature == 39
+    assert state.spray_intensity == 5
+    assert state.night_light is True
+    assert state.night_light_brightness == 80
+    assert state.active_user_profile == 2
+    assert listener.call_count == 2
+
+
+async def test_poll_after_unavailable_publishes_again(hass):
+    """Test that the first poll after an outage notifies listeners of the same state."""
+    state = DeviceState(connected=True)
+    coordinator = _coordinator(hass, state)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator._async_poll()
+    assert listener.call_count == 1
+
+    coordinator._async_handle_unavailable(MagicMock(address=MAC_ADDRESS))
+    assert listener.call_count == 2
+
+    await coordinator._async_poll()
+    assert listener.call_count == 3
@@ -0,0 +1,227 @@
+"""Tests for the Geberit AquaClean BLE protocol helpers."""
+import random
+
+import pytest
+
+from custom_components.geberit_aquaclean.protocol import (
+    BLEFrame,
+    BLEFrameCollector,
+    BLEFrameType,
+    COBSEncoder,
+    FRAME_HEADER_TABLE,
+    GeberitProtocolSerializer,
+)
+
+
+def _reference_cobs_encode(data: bytes) -> bytes:
+    """Byte-at-a-time COBS encoder the slice-based one must match."""
+    output = bytearray([0])
+    code = 1
+    code_index = 0
+    for byte in data:
+        if byte == 0:
+            output[code_index] = code
+            code_index = len(output)
+            output.append(0)
+            code = 1
+        else:
+            output.append(byte)
+            code += 1
+            if code == 255:
+                output[code_index] = code
+                code_index = len(output)
+                output.append(0)
+                code = 1
+    output[code_index] = code
+    output.append(0)
+    return bytes(output)
+
+
+def _random_payloads(count: int = 500):
+    """Yield random payloads, biased towards zeros and 254-byte block edges."""
+    rng = random.Random(0x6EBE)
+    for _ in range(count):
+        length = rng.choice(
+            (rng.randrange(0, 16), rng.randrange(250, 260), rng.randrange(0, 800))
+        )
+        zero_ratio = rng.choice((0.0, 0.05, 0.5, 1.0))
+        yield bytes(
+            0 if rng.random() < zero_ratio else rng.randrange(1, 256)
+            for _ in range(length)
+        )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x00",
+        b"\x00\x00",
+        b"\x11\x22\x00\x33",
+        b"\x01" * 253,
+        b"\x01" * 254,
+        b"\x01" * 255,
+        b"\x01" * 254 + b"\x00",
+    ],
+)
+def test_cobs_edge_cases_match_reference(data):
+    """Test the encoder on block and delimiter edge cases."""
+    encoded = COBSEncoder.encode(data)
+    assert encoded == _reference_cobs_encode(data)
+    assert 0 not in encoded[:-1]
+    assert COBSEncoder.decode(encoded) == data
+
+
+def test_cobs_random_round_trip_matches_reference():
+    """Test that random payloads encode like the reference and decode back."""
+    for data in _random_payloads():
+        encoded = COBSEncoder.encode(data)
+        assert encoded == _reference_cobs_encode(data)
+        assert COBSEncoder.decode(encoded) == data
+
+
+def test_cobs_decode_rejects_missing_delimiter():
+    """Test that a frame without the trailing zero is rejected."""
+    with pytest.raises(ValueError):
+        COBSEncoder.decode(b"\x02\x11")
+
+
+def _frame(frame_type: BLEFrameType, payload: bytes) -> BLEFrame:
+    """Build a frame of the given type."""
+    return BLEFrame(
+        frame_id=frame_type.value,
+        has_msg_type=False,
+        transaction=0,
+        flag=0,
+        payload=payload,
+    )
+
+
+def test_collector_returns_single_frame_payload():
+    """Test that a single frame is a complete message on its own."""
+    collector = BLEFrameCollector()
+    assert collector.add_frame(_frame(BLEFrameType.SINGLE_START_FRAME, b"\x01\x02"))
+    assert collector.get_complete_message() == b"\x01\x02"
+    assert collector.get_complete_message() is None
+
+
+def test_collector_skips_flow_control_frames():
+    """Test that flow control frames produce no message and leave nothing pending."""
+    collector = BLEFrameCollector()
+    for _ in range(3):
+        assert not collector.add_frame(_frame(BLEFrameType.FLOW_CONTROL_FRAME, b"\xff"))
+    assert collector.get_complete_message() is None
+    assert collector.add_frame(_frame(BLEFrameType.CONSECUTIVE_FRAME, b"\x0a"))
+    assert collector.get_complete_message() == b"\x0a"
+
+
+def test_collector_returns_messages_in_order_without_sharing_buffers():
+    """Test that queued messages come out in arrival order as independent bytes."""
+    collector = BLEFrameCollector()
+    collector.add_frame(_frame(BLEFrameType.CONSECUTIVE_FRAME, b"\x01"))
+    collector.add_frame(_frame(BLEFrameType.SINGLE_START_FRAME, b"\x02"))
+    collector.add_frame(_frame(BLEFrameType.CONSECUTIVE_FRAME, b"\x03\x04"))
+    messages = [collector.get_complete_message() for _ in range(3)]
+    assert messages == [b"\x01", b"\x02", b"\x03\x04"]
+    assert all(type(message) is bytes for message in messages)
+    assert collector.get_complete_message() is None
+
+
+def test_frame_header_table_matches_bit_layout():
+    """Test that every header byte decodes to its [ID][M][Transaction][F] fields."""
+    assert len(FRAME_HEADER_TABLE) == 256
+    for header, fields in enumerate(FRAME_HEADER_TABLE):
+        assert fields == (
+            (header >> 5) & 0x07,
+            bool((header >> 4) & 0x01),
+            (header >> 1) & 0x07,
+            header & 0x01,
+        )
+
+
+@pytest.mark.parametrize("header", range(256))
+def test_frame_header_round_trips_through_ble_frame(header):
+    """Test that parsing a frame and serializing it again keeps its bytes."""
+    if header >> 5 == BLEFrameType.CONSECUTIVE_FRAME.value:
+        data = bytes((header, 2, 0xAA, 0xBB))
+    else:
+        data = bytes((header, 0xAA, 0xBB))
+    assert BLEFrame.from_bytes(data).to_bytes() == data
+
+
+def test_ble_frame_to_bytes_packs_header_and_count():
+    """Test the packed header byte and the consecutive frame count byte."""
+    single = BLEFrame(frame_id=0, has_msg_type=True, transaction=1, flag=0, payload=b"ab")
+    assert single.to_bytes() == b"\x12ab"
+    consecutive = BLEFrame(
+        frame_id=BLEFrameType.CONSECUTIVE_FRAME.value,
+        has_msg_type=True,
+        transaction=0,
+        flag=0,
+        payload=b"\x01\x02",
+    )
+    assert consecutive.to_bytes() == b"\x50\x02\x01\x02"
+
+
+def test_deserialize_device_identification_splits_null_terminated_strings():
+    """Test that empty strings are skipped and an unterminated last string is kept."""
+    data = "AquaClean Sela\x00\x00SN-123\x00146.21x.xx.1\x00RS28".encode()
+    device_id = GeberitProtocolSerializer.deserialize_device_identification(data)
+    assert device_id.description == "AquaClean Sela"
+    assert device_id.serial_number == "SN-123"
+    assert device_id.sap_number == "146.21x.xx.1"
+    assert device_id.firmware_version == "RS28"
+
+
+def test_deserialize_device_identification_keeps_multibyte_text():
+    """Test that UTF-8 text spanning several bytes is decoded per string."""
+    data = "Dusch-WC Größe\x00Seriennr.".encode()
+    device_id = GeberitProtocolSerializer.deserialize_device_identification(data)
+    assert device_id.description == "Dusch-WC Größe"
+    assert device_id.serial_number == "Seriennr."
+
+
+def test_parse_device_info_response_reads_fields_in_place():
+    """Test the little-endian SAP and serial words and the firmware bytes."""
+    data = b"\x01\x02\x03\x04\x05\x06\x07\x08Sela\x00"
+    device_info = GeberitProtocolSerializer.parse_device_info_response(data)
+    assert device_info.sap_number == "SAP-513"
+    assert device_info.serial_number == "SN-00001027"
+    assert device_info.firmware_version == "FW-5.6.7.8"
+    assert device_info.description == "Sela"
+
+
+def test_parse_system_status_response_reads_leading_status_bytes():
+    """Test that the first six bytes map onto the running and maintenance flags."""
+    params = GeberitProtocolSerializer.parse_system_status_response(
+        bytes((1, 0, 2, 1, 0, 0, 0xFF))
+    )
+    assert params.anal_shower_running
+    assert not params.lady_shower_running
+    assert params.dryer_running
+    assert params.user_is_sitting
+    assert not params.descaling_needed
+
+
+def test_parse_system_status_response_ignores_short_data():
+    """Test that a truncated response yields default parameters."""
+    params = GeberitProtocolSerializer.parse_system_status_response(b"\x01\x01")
+    assert not params.anal_shower_running
+    assert not params.user_is_sitting
+
+
+def test_parse_device_notification_reads_maintenance_flags():
+    """Test the little-endian maintenance word at offset 10."""
+    header = bytes.fromhex("30140c0300030000")
+    device_id = b"\x31\x30"
+    tail = b"\x00\x00\xcf\x08"
+    params = GeberitProtocolSerializer.parse_device_notification(
+        header + device_id + b"\x02\x00" + tail
+    )
+    assert not params.descaling_needed
+    assert params.filter_replacement_needed
+    params = GeberitProtocolSerializer.parse_device_notification(
+        header + device_id + b"\x01\x00" + tail
+    )
+    assert params.descaling_needed
+    assert not params.filter_replacement_needed